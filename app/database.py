@@ -1,6 +1,36 @@
 import sqlite3
 import csv
-from PyQt6.QtCore import pyqtSignal, QObject
+import re
+import unicodedata
+import uuid
+from contextlib import contextmanager
+from itertools import groupby, islice
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer
+from .datagen import generate_tables
+from .parallel_import import get_type_name, parse_csv_parallel
+from .query_stats import InstrumentedConnection, QueryStats, SlowQueryLog
+
+FOLDED_LETTERS = str.maketrans({"ł": "l", "ø": "o", "đ": "d", "ß": "ss"})
+
+
+def normalize_text(value):
+    """
+    Normalizes text for case- and diacritic-insensitive searching.
+    - Folds case.
+    - Strips combining diacritics, e.g. "ś" becomes "s".
+    - Replaces letters without a decomposition, e.g. "ł" becomes "l".
+
+    Args:
+        value (str): The text to normalize.
+
+    Returns:
+        str: The normalized text, or None if value is None.
+    """
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", str(value).casefold().translate(FOLDED_LETTERS))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
 
 class Database(QObject):
     """
@@ -8,22 +38,183 @@ class Database(QObject):
     
     Attributes:
         record_updated (pyqtSignal): Signal emitted when a record is updated.
+        records_changed (pyqtSignal): Signal emitted after a commit with the table, the operation
+            ("insert", "update", "delete" or "import") and the IDs of the affected records (empty for "import").
+        TABLES (list): Names of the tables, in the order they appear in CSV exports.
+        INDEXES (dict): Secondary indexes on join, filter and sort columns, mapping index name to (table, columns).
+        SEARCH_INDEXES (dict): Full-text searchable columns, mapping table name to its list of text columns.
+        COLUMN_STATS (dict): Filterable columns whose distinct values and counts are kept in the column_values table,
+            mapping table name to its list of columns.
     """
     
     record_updated = pyqtSignal()
+    records_changed = pyqtSignal(str, str, list)
+    TABLES = ["customers", "orders", "products", "suppliers"]
+    INDEXES = {
+        "idx_customers_name": ("customers", ["name"]),
+        "idx_customers_city": ("customers", ["city"]),
+        "idx_orders_customer_id": ("orders", ["customer_id"]),
+        "idx_orders_product_id": ("orders", ["product_id"]),
+        "idx_orders_date": ("orders", ["date"]),
+        "idx_orders_status": ("orders", ["status"]),
+        "idx_orders_amount": ("orders", ["amount"]),
+        "idx_products_name": ("products", ["name"]),
+        "idx_products_category": ("products", ["category"]),
+        "idx_products_price": ("products", ["price"]),
+        "idx_products_stock": ("products", ["stock"]),
+        "idx_customer_orders_customer_id": ("customer_orders", ["customer_id"]),
+        "idx_customer_orders_customer_name": ("customer_orders", ["customer_name"]),
+        "idx_customer_orders_order_date": ("customer_orders", ["order_date"]),
+        "idx_customer_orders_order_amount": ("customer_orders", ["order_amount"]),
+        "idx_customer_orders_product_id": ("customer_orders", ["product_id"]),
+        "idx_customer_orders_product_name": ("customer_orders", ["product_name"]),
+        "idx_customer_orders_product_price": ("customer_orders", ["product_price"]),
+        "idx_column_values_count": ("column_values", ["table_name", "column_name", "count DESC", "value"]),
+        "idx_column_values_prefix": ("column_values", ["table_name", "column_name", "lower(value)"]),
+    }
+    SEARCH_INDEXES = {
+        "customers": ["name"],
+        "products": ["name"],
+    }
+    COLUMN_STATS = {
+        "customers": ["city"],
+        "orders": ["customer_id", "product_id", "status", "amount"],
+        "products": ["category", "price", "stock"],
+    }
 
-    def __init__(self):
+    def __init__(self, path=":memory:", synchronous="NORMAL", cache_size=-64000, mmap_size=268435456,
+                 instrument=False, slow_query_log=None, slow_query_threshold=0.1):
         """
         Initializes the Database object.
-        - Connects to an in-memory SQLite database.
-        - Creates necessary tables.
-        - Populates initial data.
+        - Connects to an in-memory SQLite database, or to the database file at path.
+          In-memory databases use a named shared cache, so worker threads can open their own connections to them.
+        - Configures journaling and caching of the connection.
+        - Creates necessary tables and populates initial data, unless the file already holds them.
+          Otherwise rebuilds missing derived tables and indexes of the file and commits them.
+
+        Args:
+            path (str): Path to the database file. Defaults to ":memory:".
+            synchronous (str): SQLite synchronous mode (OFF, NORMAL, FULL or EXTRA). Defaults to "NORMAL".
+            cache_size (int): Page cache size, in pages if positive or in KiB if negative. Defaults to 64 MiB.
+            mmap_size (int): Maximum number of bytes of the file to memory-map. Defaults to 256 MiB.
+            instrument (bool): Whether to record statistics of the statements run on all connections,
+                available through get_query_stats. Defaults to False.
+            slow_query_log (str, optional): Path to a rotating log file of the statements taking at least
+                slow_query_threshold, with their parameter types and query plans. Enables instrumentation.
+                Defaults to None, which disables the log.
+            slow_query_threshold (float, optional): Latency in seconds from which a statement is logged. Defaults to 0.1.
+
+        Raises:
+            ValueError: If synchronous is not a valid SQLite synchronous mode.
         """
         super().__init__()
-        self.conn = sqlite3.connect(":memory:")
+        if synchronous.upper() not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError(f"Invalid synchronous mode: {synchronous}")
+        self.path = path
+        self.transaction_depth = 0
+        self.update_pending = False
+        self.pending_changes = {}
+        self.write_behind_timer = None
+        self.schema_catalog = {}
+        self.statement_cache = {}
+        self.slow_query_log = SlowQueryLog(slow_query_log, slow_query_threshold) if slow_query_log else None
+        self.query_stats = QueryStats() if instrument or self.slow_query_log else None
+        self.uri = None if self.is_file_backed() else f"file:memdb-{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self.conn = self.connect(check_same_thread=True)
         self.c = self.conn.cursor()
-        self.create_tables()
-        self.populate_initial_data()
+        self.configure_connection(synchronous, cache_size, mmap_size)
+        if not self.table_exists("customers"):
+            self.create_tables()
+            self.populate_initial_data()
+        else:
+            self.create_customer_orders()
+            self.create_column_stats()
+            self.create_indexes()
+            self.create_search_indexes()
+            self.conn.commit()
+
+    def is_file_backed(self):
+        """
+        Checks whether the database is stored in a file.
+
+        Returns:
+            bool: True if the database is stored on disk, False if it lives in memory.
+        """
+        return self.path != ":memory:"
+
+    def connect(self, check_same_thread=False):
+        """
+        Opens a new connection to the database, e.g. for a worker thread.
+        - Registers the application SQL functions on the connection.
+        - Records statement statistics into query_stats and logs slow statements, if instrumentation is enabled.
+        - Lets connections to an in-memory database read uncommitted data,
+          so readers do not wait for table locks held by the writer.
+
+        Args:
+            check_same_thread (bool, optional): Whether only the creating thread may use the connection. Defaults to False.
+
+        Returns:
+            sqlite3.Connection: The new connection.
+        """
+        factory = InstrumentedConnection if self.query_stats else sqlite3.Connection
+        if self.is_file_backed():
+            conn = sqlite3.connect(self.path, check_same_thread=check_same_thread, factory=factory)
+        else:
+            conn = sqlite3.connect(self.uri, uri=True, check_same_thread=check_same_thread, factory=factory)
+        if self.query_stats:
+            conn.query_stats = self.query_stats
+            conn.slow_query_log = self.slow_query_log
+        if not self.is_file_backed():
+            conn.execute("PRAGMA read_uncommitted=1")
+        conn.create_function("normalize", 1, normalize_text, deterministic=True)
+        return conn
+
+    def get_query_stats(self):
+        """
+        Retrieves statistics of the statements run since instrumentation was enabled or last reset.
+
+        Returns:
+            list: Statistics of each statement shape as returned by QueryStats.snapshot, slowest first,
+                or an empty list if instrumentation is disabled.
+        """
+        return self.query_stats.snapshot() if self.query_stats else []
+
+    def reset_query_stats(self):
+        """
+        Clears the recorded statement statistics.
+        """
+        if self.query_stats:
+            self.query_stats.reset()
+
+    def configure_connection(self, synchronous, cache_size, mmap_size):
+        """
+        Applies journaling and caching settings to the connection.
+        - Switches file databases to WAL journaling, so readers do not block the writer.
+        - Sets the synchronous mode, page cache size and memory-mapped I/O size.
+
+        Args:
+            synchronous (str): SQLite synchronous mode.
+            cache_size (int): Page cache size, in pages if positive or in KiB if negative.
+            mmap_size (int): Maximum number of bytes of the file to memory-map.
+        """
+        if self.is_file_backed():
+            self.c.execute("PRAGMA journal_mode=WAL")
+            self.c.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self.c.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self.c.execute(f"PRAGMA cache_size={int(cache_size)}")
+
+    def table_exists(self, table):
+        """
+        Checks whether a table exists in the database.
+
+        Args:
+            table (str): The name of the table.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        self.c.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table,))
+        return self.c.fetchone() is not None
 
     def create_tables(self):
         """
@@ -33,6 +224,7 @@ class Database(QObject):
         - products
         - suppliers
         """
+        self.invalidate_schema()
         self.c.execute('''CREATE TABLE customers (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -68,6 +260,309 @@ class Database(QObject):
             email TEXT NOT NULL
         )''')
 
+        self.create_customer_orders()
+        self.create_column_stats()
+        self.create_indexes()
+        self.create_search_indexes()
+
+    def create_customer_orders(self):
+        """
+        Creates the customer_orders table, a materialized join of orders with their customer and product.
+        - Each order with an existing customer and product has one row, keyed by order_id.
+        - Triggers on the three base tables insert, update and delete only the rows an edit affects.
+        - A newly created table is filled with a single join over the existing rows.
+        """
+        exists = self.table_exists("customer_orders")
+        self.c.execute("""CREATE TABLE IF NOT EXISTS customer_orders (
+            order_id INTEGER PRIMARY KEY,
+            customer_id INTEGER NOT NULL,
+            customer_name TEXT NOT NULL,
+            order_date TEXT NOT NULL,
+            order_amount INTEGER NOT NULL,
+            product_id INTEGER NOT NULL,
+            product_name TEXT NOT NULL,
+            product_price REAL NOT NULL
+        )""")
+        select = """SELECT orders.id, customers.id, customers.name, orders.date, orders.amount,
+                           products.id, products.name, products.price
+                    FROM orders
+                    JOIN customers ON customers.id = orders.customer_id
+                    JOIN products ON products.id = orders.product_id"""
+        self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS orders_join_insert AFTER INSERT ON orders BEGIN
+            INSERT INTO customer_orders {select} WHERE orders.id = new.id;
+        END""")
+        self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS orders_join_update
+            AFTER UPDATE OF id, customer_id, product_id, date, amount ON orders BEGIN
+            DELETE FROM customer_orders WHERE order_id = old.id;
+            INSERT INTO customer_orders {select} WHERE orders.id = new.id;
+        END""")
+        self.c.execute("""CREATE TRIGGER IF NOT EXISTS orders_join_delete AFTER DELETE ON orders BEGIN
+            DELETE FROM customer_orders WHERE order_id = old.id;
+        END""")
+        for table, prefix, columns in [("customers", "customer", ["name"]), ("products", "product", ["name", "price"])]:
+            assignments = ", ".join(f"{prefix}_{column} = new.{column}" for column in columns)
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_join_insert AFTER INSERT ON {table} BEGIN
+                INSERT OR IGNORE INTO customer_orders {select} WHERE orders.{prefix}_id = new.id;
+            END""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_join_update
+                AFTER UPDATE OF {", ".join(columns)} ON {table} BEGIN
+                UPDATE customer_orders SET {assignments} WHERE {prefix}_id = new.id;
+            END""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_join_delete AFTER DELETE ON {table} BEGIN
+                DELETE FROM customer_orders WHERE {prefix}_id = old.id;
+            END""")
+        if not exists:
+            self.c.execute(f"INSERT INTO customer_orders {select}")
+            self.create_indexes([name for name, (table, _) in self.INDEXES.items() if table == "customer_orders"])
+
+    def drop_customer_orders(self):
+        """
+        Drops the customer_orders table, its indexes and the triggers that maintain it.
+        """
+        self.c.execute("DROP TABLE IF EXISTS customer_orders")
+        for table in ["orders", "customers", "products"]:
+            for operation in ["insert", "update", "delete"]:
+                self.c.execute(f"DROP TRIGGER IF EXISTS {table}_join_{operation}")
+
+    def create_indexes(self, names=None):
+        """
+        Creates declared secondary indexes that do not exist yet.
+
+        Args:
+            names (list, optional): Names of the indexes to create. Defaults to all indexes in INDEXES.
+        """
+        for name in names if names is not None else self.INDEXES:
+            table, columns = self.INDEXES[name]
+            self.c.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+    def drop_indexes(self, names=None):
+        """
+        Drops declared secondary indexes that exist.
+
+        Args:
+            names (list, optional): Names of the indexes to drop. Defaults to all indexes in INDEXES.
+        """
+        for name in names if names is not None else self.INDEXES:
+            self.c.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def create_search_indexes(self):
+        """
+        Creates FTS5 full-text indexes over the columns in SEARCH_INDEXES.
+        - Each index is a contentless table named after its table with an "_fts" suffix.
+        - The tokenizer folds case and removes diacritics, and the letters in FOLDED_LETTERS are replaced
+          in plain SQL, so matching ignores case and diacritics like normalize_text.
+        - Triggers keep the index in sync with inserts, updates and deletes. They only use built-in SQL functions,
+          so other clients, e.g. the sqlite3 shell, can write to the tables.
+        - Newly created indexes are filled with the existing rows.
+        - Indexes of older versions, whose triggers call the application normalize function, are rebuilt.
+        """
+        self.c.execute("""SELECT 1 FROM sqlite_master
+                          WHERE type='trigger' AND name LIKE '%\\_fts\\_%' ESCAPE '\\' AND sql LIKE '%normalize(%'""")
+        if self.c.fetchone():
+            self.drop_search_indexes()
+        for table, columns in self.SEARCH_INDEXES.items():
+            fts_table = f"{table}_fts"
+            column_list = ", ".join(columns)
+            folded_columns = ", ".join(self.get_fold_expression(column) for column in columns)
+            new_values = ", ".join(self.get_fold_expression(f"new.{column}") for column in columns)
+            old_values = ", ".join(self.get_fold_expression(f"old.{column}") for column in columns)
+            exists = self.table_exists(fts_table)
+
+            self.c.execute(f"""CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                {column_list}, content='', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+            END""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_update AFTER UPDATE OF {column_list} ON {table} BEGIN
+                INSERT INTO {fts_table} ({fts_table}, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts_table} (rowid, {column_list}) VALUES (new.id, {new_values});
+            END""")
+            if not exists:
+                self.c.execute(f"INSERT INTO {fts_table} (rowid, {column_list}) SELECT id, {folded_columns} FROM {table}")
+
+    def get_fold_expression(self, value):
+        """
+        Builds an SQL expression replacing the letters in FOLDED_LETTERS, in both cases, which the FTS5 tokenizer
+        does not fold because they have no decomposition.
+
+        Args:
+            value (str): SQL expression of the text.
+
+        Returns:
+            str: The SQL expression.
+        """
+        for code, replacement in FOLDED_LETTERS.items():
+            for letter in dict.fromkeys([chr(code), chr(code).upper()]):
+                if len(letter) == 1:
+                    value = f"replace({value}, '{letter}', '{replacement}')"
+        return value
+
+    def drop_search_indexes(self):
+        """
+        Drops the FTS5 full-text indexes and the triggers that maintain them.
+        """
+        for table in self.SEARCH_INDEXES:
+            self.c.execute(f"DROP TABLE IF EXISTS {table}_fts")
+            for operation in ["insert", "delete", "update"]:
+                self.c.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{operation}")
+
+    def create_column_stats(self):
+        """
+        Creates the column_values table holding the distinct values of the columns in COLUMN_STATS.
+        - Each row holds a table name, a column name, a value and the number of rows with that value.
+        - Triggers keep the counts in sync with inserts, updates and deletes, and remove values no row uses anymore.
+        - A newly created table is filled from the existing rows and gets its indexes.
+
+        The primary key orders values by column, so distinct values and minimum and maximum
+        are read from the index instead of scanning the table. The idx_column_values_* indexes
+        serve get_column_facets.
+        """
+        exists = self.table_exists("column_values")
+        self.c.execute("""CREATE TABLE IF NOT EXISTS column_values (
+            table_name TEXT NOT NULL,
+            column_name TEXT NOT NULL,
+            value,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (table_name, column_name, value)
+        )""")
+        for table, columns in self.COLUMN_STATS.items():
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_stats_insert AFTER INSERT ON {table} BEGIN
+                {"".join(self.get_column_stats_increment(table, column, "new") for column in columns)}
+            END""")
+            self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_stats_delete AFTER DELETE ON {table} BEGIN
+                {"".join(self.get_column_stats_decrement(table, column, "old") for column in columns)}
+            END""")
+            for column in columns:
+                self.c.execute(f"""CREATE TRIGGER IF NOT EXISTS {table}_{column}_stats_update
+                    AFTER UPDATE OF {column} ON {table} WHEN old.{column} IS NOT new.{column} BEGIN
+                    {self.get_column_stats_decrement(table, column, "old")}
+                    {self.get_column_stats_increment(table, column, "new")}
+                END""")
+                if not exists:
+                    self.c.execute(f"""INSERT INTO column_values
+                                       SELECT '{table}', '{column}', {column}, COUNT(*) FROM {table} GROUP BY {column}""")
+        if not exists:
+            self.create_indexes([name for name, (table, _) in self.INDEXES.items() if table == "column_values"])
+
+    def get_column_stats_increment(self, table, column, row):
+        """
+        Builds the trigger statements counting the value of a column in a new row.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The name of the column.
+            row (str): The trigger row holding the value, "new" or "old".
+
+        Returns:
+            str: The SQL statements.
+        """
+        match = f"table_name='{table}' AND column_name='{column}' AND value IS {row}.{column}"
+        return f"""INSERT INTO column_values SELECT '{table}', '{column}', {row}.{column}, 0
+                   WHERE NOT EXISTS (SELECT 1 FROM column_values WHERE {match});
+                   UPDATE column_values SET count=count+1 WHERE {match};"""
+
+    def get_column_stats_decrement(self, table, column, row):
+        """
+        Builds the trigger statements uncounting the value of a column in a removed row.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The name of the column.
+            row (str): The trigger row holding the value, "new" or "old".
+
+        Returns:
+            str: The SQL statements.
+        """
+        match = f"table_name='{table}' AND column_name='{column}' AND value IS {row}.{column}"
+        return f"""UPDATE column_values SET count=count-1 WHERE {match};
+                   DELETE FROM column_values WHERE {match} AND count <= 0;"""
+
+    def drop_column_stats(self):
+        """
+        Drops the column_values table and the triggers that maintain it.
+        """
+        self.c.execute("DROP TABLE IF EXISTS column_values")
+        for table, columns in self.COLUMN_STATS.items():
+            self.c.execute(f"DROP TRIGGER IF EXISTS {table}_stats_insert")
+            self.c.execute(f"DROP TRIGGER IF EXISTS {table}_stats_delete")
+            for column in columns:
+                self.c.execute(f"DROP TRIGGER IF EXISTS {table}_{column}_stats_update")
+
+    def build_match_query(self, text):
+        """
+        Builds an FTS5 query matching rows in which every word of the text starts a word of the indexed columns.
+        The text is normalized like the indexed values.
+
+        Args:
+            text (str): The search text.
+
+        Returns:
+            str: The FTS5 query, or None if the text contains no words.
+        """
+        words = re.findall(r"\w+", normalize_text(text))
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    def get_indexes(self, table=None):
+        """
+        Retrieves the names of existing secondary indexes.
+
+        Args:
+            table (str, optional): Only return indexes of this table. Defaults to all tables.
+
+        Returns:
+            list: A list of index names.
+        """
+        query = "SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL"
+        params = []
+        if table:
+            query += " AND tbl_name=?"
+            params.append(table)
+        self.c.execute(query + " ORDER BY name", params)
+        return [row[0] for row in self.c.fetchall()]
+
+    def explain_query_plan(self, query, params=()):
+        """
+        Retrieves the query plan SQLite chooses for a query.
+
+        Args:
+            query (str): The SQL query.
+            params (list, optional): Parameters bound to the query. Defaults to ().
+
+        Returns:
+            list: The detail line of each step of the plan.
+        """
+        # The plan is computed when the statement is prepared, so the schema version keeps
+        # the statement cache from returning a plan made before indexes were created or dropped
+        schema_version = self.conn.execute("PRAGMA schema_version").fetchone()[0]
+        cursor = self.conn.execute(f"EXPLAIN QUERY PLAN /* schema {schema_version} */ {query}", params)
+        return [row[3] for row in cursor.fetchall()]
+
+    def get_used_indexes(self, query, params=()):
+        """
+        Retrieves the indexes used by the query plan of a query.
+        Full-text indexes queried with MATCH are reported by the name of their virtual table.
+
+        Args:
+            query (str): The SQL query.
+            params (list, optional): Parameters bound to the query. Defaults to ().
+
+        Returns:
+            list: Names of the used indexes, in plan order and without duplicates.
+        """
+        indexes = []
+        for detail in self.explain_query_plan(query, params):
+            for index, fts_table in re.findall(r"USING (?:COVERING )?INDEX (\w+)|SCAN (\w+) VIRTUAL TABLE INDEX \d+:M", detail):
+                name = index or fts_table
+                if name not in indexes:
+                    indexes.append(name)
+        return indexes
+
     def populate_initial_data(self):
         """
         Populates the tables with initial data:
@@ -126,12 +621,196 @@ class Database(QObject):
         Returns:
             list: A list of tuples representing customer orders.
         """
-        self.c.execute('''SELECT customers.id, customers.name, orders.date, orders.amount, products.name, products.price
-                          FROM customers
-                          JOIN orders ON customers.id = orders.customer_id
-                          JOIN products ON orders.product_id = products.id''')
+        self.c.execute('''SELECT customer_id, customer_name, order_date, order_amount, product_name, product_price
+                          FROM customer_orders
+                          ORDER BY customer_id, order_id''')
+        return self.c.fetchall()
+
+    def fetch_page(self, table, after_key=None, limit=100, order_by="id", filters=None, descending=False):
+        """
+        Fetches a page of rows from a table using keyset pagination.
+        - Rows are ordered by order_by and then by id, so the order is total even for duplicate values.
+        - Each page seeks past the key of the last row of the previous page instead of using OFFSET,
+          so any page costs the same as the first one.
+        
+        Args:
+            table (str): The name of the table.
+            after_key (optional): Key of the last row of the previous page, or None for the first page.
+                The id when ordering by id, otherwise a tuple of the order_by value and the id.
+            limit (int, optional): Maximum number of rows to return. Defaults to 100.
+            order_by (str, optional): The name of the column to order by. Defaults to "id".
+            filters (dict, optional): Dictionary mapping column names to a value, a list of allowed values,
+                or a dictionary with optional "min" and "max" bounds. Defaults to None.
+            descending (bool, optional): Whether to order from the largest value. Defaults to False.
+        
+        Returns:
+            list: A list of tuples representing the rows of the page.
+        
+        Raises:
+            ValueError: If the table or one of the columns does not exist.
+        """
+        if table not in self.TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        columns = self.get_column_names(table)
+        for column in [order_by, *(filters or {})]:
+            if column not in columns:
+                raise ValueError(f"Unknown column: {column}")
+
+        conditions = []
+        params = []
+        for column, value in (filters or {}).items():
+            if isinstance(value, list):
+                conditions.append(f"{column} IN ({', '.join(['?'] * len(value))})")
+                params.extend(value)
+            elif isinstance(value, dict):
+                if value.get("min") is not None:
+                    conditions.append(f"{column} >= ?")
+                    params.append(value["min"])
+                if value.get("max") is not None:
+                    conditions.append(f"{column} <= ?")
+                    params.append(value["max"])
+            else:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        nullable = order_by in self.get_nullable_columns(table)
+        keyset_condition, keyset_params, order = self.build_keyset_clause("id", after_key, order_by, descending, nullable)
+        if keyset_condition:
+            conditions.append(keyset_condition)
+            params.extend(keyset_params)
+
+        query = f"SELECT * FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order} LIMIT ?"
+        self.c.execute(query, params + [limit])
+        return self.c.fetchall()
+
+    def fetch_query_page(self, query, params=(), after_key=None, limit=100, key="id", order_by=None, descending=False,
+                         nullable=False):
+        """
+        Fetches a page of the rows returned by a query using keyset pagination.
+        The query is used as a subquery, so it must select the key and order_by columns under
+        unique names and must not have its own ORDER BY or LIMIT clause.
+        
+        Args:
+            query (str): The SQL query.
+            params (list, optional): Parameters bound to the query. Defaults to ().
+            after_key (optional): Key of the last row of the previous page, or None for the first page.
+                The key value when ordering by the key, otherwise a tuple of the order_by value and the key value.
+            limit (int, optional): Maximum number of rows to return. Defaults to 100.
+            key (str, optional): Name of a column that uniquely identifies the rows. Defaults to "id".
+            order_by (str, optional): Name of the column to order by. Defaults to the key column.
+            descending (bool, optional): Whether to order from the largest value. Defaults to False.
+            nullable (bool, optional): Whether the order_by column can contain NULL values. Defaults to False.
+        
+        Returns:
+            list: A list of tuples representing the rows of the page.
+        """
+        page_query, page_params = self.build_query_page(query, params, after_key, limit, key, order_by, descending,
+                                                        nullable)
+        self.c.execute(page_query, page_params)
         return self.c.fetchall()
 
+    def fetch_query_records(self, query, params, column, values, chunk_size=500, until_key=None, key="id",
+                            order_by=None, descending=False, nullable=False):
+        """
+        Fetches the rows returned by a query whose column holds one of the given values.
+        The query is used as a subquery, so it must select the column under a unique name.
+
+        Args:
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+            column (str): Name of the column to match.
+            values (list): Values to match, bound in chunks to stay below the SQLite parameter limit.
+            chunk_size (int, optional): Maximum number of values bound to a single statement. Defaults to 500.
+            until_key (optional): Key of the last row to return in the page order, as for the after_key
+                of build_query_page, or None to return all matching rows.
+            key (str, optional): Name of a column that uniquely identifies the rows. Defaults to "id".
+            order_by (str, optional): Name of the column the pages are ordered by. Defaults to the key column.
+            descending (bool, optional): Whether the pages are ordered from the largest value. Defaults to False.
+            nullable (bool, optional): Whether the order_by column can contain NULL values. Defaults to False.
+
+        Returns:
+            list: A list of tuples representing the matching rows.
+        """
+        condition, condition_params = "", []
+        if until_key is not None:
+            after_condition, condition_params, _ = self.build_keyset_clause(key, until_key, order_by or key,
+                                                                            descending, nullable)
+            # Rows sorting after until_key are excluded; IS NOT 1 also keeps rows the condition yields NULL for
+            condition = f" AND ({after_condition}) IS NOT 1"
+        records = []
+        values = list(values)
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            self.c.execute(f"SELECT * FROM ({query}) WHERE {column} IN ({', '.join(['?'] * len(chunk))}){condition}",
+                           [*params, *chunk, *condition_params])
+            records.extend(self.c.fetchall())
+        return records
+
+    def build_query_page(self, query, params=(), after_key=None, limit=100, key="id", order_by=None, descending=False,
+                         nullable=False):
+        """
+        Builds the query fetching a page of the rows returned by a query, for fetch_query_page.
+        
+        Args:
+            query (str): The SQL query.
+            params (list, optional): Parameters bound to the query. Defaults to ().
+            after_key (optional): Key of the last row of the previous page, or None for the first page.
+            limit (int, optional): Maximum number of rows to return. Defaults to 100.
+            key (str, optional): Name of a column that uniquely identifies the rows. Defaults to "id".
+            order_by (str, optional): Name of the column to order by. Defaults to the key column.
+            descending (bool, optional): Whether to order from the largest value. Defaults to False.
+            nullable (bool, optional): Whether the order_by column can contain NULL values. Defaults to False.
+        
+        Returns:
+            tuple: The SQL query of the page and the list of its parameters.
+        """
+        keyset_condition, keyset_params, order = self.build_keyset_clause(key, after_key, order_by or key, descending,
+                                                                           nullable)
+        page_query = f"SELECT * FROM ({query})"
+        if keyset_condition:
+            page_query += f" WHERE {keyset_condition}"
+        page_query += f" ORDER BY {order} LIMIT ?"
+        return page_query, [*params, *keyset_params, limit]
+
+    def build_keyset_clause(self, key, after_key, order_by, descending, nullable=False):
+        """
+        Builds the condition and ordering of a keyset-paginated query.
+        
+        Args:
+            key (str): Name of the column that uniquely identifies the rows.
+            after_key: Key of the last row of the previous page, or None for the first page.
+            order_by (str): Name of the column to order by.
+            descending (bool): Whether to order from the largest value.
+            nullable (bool, optional): Whether the order_by column can contain NULL values. Defaults to False.
+        
+        Returns:
+            tuple: The condition (None for the first page), its parameters and the ORDER BY expression.
+        """
+        operator, direction = ("<", "DESC") if descending else (">", "ASC")
+        if order_by == key:
+            order = f"{key} {direction}"
+            if after_key is None:
+                return None, [], order
+            return f"{key} {operator} ?", [after_key], order
+
+        order = f"{order_by} {direction}, {key} {direction}"
+        if after_key is None:
+            return None, [], order
+        after_value, after_id = after_key
+        if after_value is None:
+            # NULL values sort first in ascending and last in descending order
+            condition = f"({order_by} IS NULL AND {key} {operator} ?)"
+            if not descending:
+                condition = f"({condition} OR {order_by} IS NOT NULL)"
+            return condition, [after_id], order
+        condition = f"({order_by}, {key}) {operator} (?, ?)"
+        if descending and nullable:
+            condition = f"({condition} OR {order_by} IS NULL)"
+        return condition, [after_value, after_id], order
+
     def delete_record(self, table, record_id):
         """
         Deletes a record from a table.
@@ -140,8 +819,32 @@ class Database(QObject):
             table (str): The name of the table.
             record_id (int): The ID of the record to delete.
         """
-        self.c.execute(f"DELETE FROM {table} WHERE id=?", (record_id,))
-        self.conn.commit()
+        with self.transaction():
+            self.c.execute(f"DELETE FROM {table} WHERE id=?", (record_id,))
+            self.record_change(table, "delete", [record_id])
+
+    def delete_records(self, table, record_ids, chunk_size=500):
+        """
+        Deletes several records from a table in a single transaction.
+        Duplicate IDs are ignored, and IDs are bound in chunks to stay below the SQLite parameter limit.
+        
+        Args:
+            table (str): The name of the table.
+            record_ids (iterable): The IDs of the records to delete.
+            chunk_size (int, optional): Maximum number of IDs bound to a single statement. Defaults to 500.
+        
+        Returns:
+            int: The number of deleted records.
+        """
+        record_ids = list(dict.fromkeys(record_ids))
+        deleted = 0
+        with self.transaction():
+            for start in range(0, len(record_ids), chunk_size):
+                chunk = record_ids[start:start + chunk_size]
+                self.c.execute(f"DELETE FROM {table} WHERE id IN ({', '.join(['?'] * len(chunk))})", chunk)
+                deleted += self.c.rowcount
+            self.record_change(table, "delete", record_ids)
+        return deleted
 
     def update_record(self, table, record_id, column_name, new_value):
         """
@@ -158,62 +861,273 @@ class Database(QObject):
         """
         if column_name.lower() == "id":
             raise ValueError("Cannot update the primary ID field")
-        column_name = column_name.replace(" ", "_")
-        self.c.execute(f'UPDATE "{table}" SET "{column_name}"=? WHERE id=?', (new_value, record_id))
+        key = ("update", table, column_name)
+        if key not in self.statement_cache:
+            self.statement_cache[key] = f'UPDATE "{table}" SET "{column_name.replace(" ", "_")}"=? WHERE id=?'
+        with self.transaction():
+            self.c.execute(self.statement_cache[key], (new_value, record_id))
+            self.update_pending = True
+            self.record_change(table, "update", [record_id])
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups writes into a single unit of work.
+        - Writes made inside the block are committed once, when the outermost block exits.
+        - If the block raises an exception, only its own writes are rolled back, to a savepoint taken when it started,
+          so writes of earlier blocks still waiting for a write-behind flush are kept.
+        - record_updated is emitted at most once, after the commit.
+        - records_changed is emitted once per table and operation, after the commit.
+        - Nested blocks join the outermost one.
+
+        In write-behind mode, the commit is deferred further, until the next flush.
+
+        Yields:
+            Database: This database.
+        """
+        if self.transaction_depth == 0:
+            # An explicit BEGIN keeps RELEASE from committing when the savepoint would start the transaction
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            self.conn.execute("SAVEPOINT unit_of_work")
+            saved_changes = {key: dict(ids) for key, ids in self.pending_changes.items()}
+            saved_update_pending = self.update_pending
+        self.transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self.transaction_depth -= 1
+            if self.transaction_depth == 0:
+                self.conn.execute("ROLLBACK TO unit_of_work")
+                self.conn.execute("RELEASE unit_of_work")
+                self.pending_changes = saved_changes
+                self.update_pending = saved_update_pending
+                if not self.write_behind_timer:
+                    self.flush()
+            raise
+        self.transaction_depth -= 1
+        if self.transaction_depth == 0:
+            self.conn.execute("RELEASE unit_of_work")
+            if self.write_behind_timer:
+                if not self.write_behind_timer.isActive():
+                    self.write_behind_timer.start()
+            else:
+                self.flush()
+
+    def flush(self):
+        """
+        Commits pending writes and emits the coalesced change signals.
+        """
+        if self.write_behind_timer:
+            self.write_behind_timer.stop()
         self.conn.commit()
-        self.record_updated.emit()
+        changes, self.pending_changes = self.pending_changes, {}
+        for (table, operation), ids in changes.items():
+            self.records_changed.emit(table, operation, list(ids))
+        if self.update_pending:
+            self.update_pending = False
+            self.record_updated.emit()
+
+    def record_change(self, table, operation, ids):
+        """
+        Records IDs of changed records, to be announced by records_changed once the change is committed.
+
+        Args:
+            table (str): The name of the table.
+            operation (str): "insert", "update" or "delete".
+            ids (list): IDs of the affected records.
+        """
+        self.pending_changes.setdefault((table, operation), {}).update(dict.fromkeys(ids))
 
-    def export_to_csv(self, file_name):
+    def set_write_behind(self, interval=300):
+        """
+        Enables or disables write-behind mode.
+        In write-behind mode, writes are committed and record_updated is emitted at most once per interval,
+        so bursts of edits from the GUI share one commit and one refresh.
+
+        Args:
+            interval (int, optional): Flush interval in milliseconds, or None to disable the mode
+                and flush pending writes. Defaults to 300.
+        """
+        if interval is None:
+            if self.write_behind_timer:
+                self.flush()
+                self.write_behind_timer.deleteLater()
+                self.write_behind_timer = None
+            return
+        if not self.write_behind_timer:
+            self.write_behind_timer = QTimer(self)
+            self.write_behind_timer.setSingleShot(True)
+            self.write_behind_timer.timeout.connect(self.flush)
+        self.write_behind_timer.setInterval(interval)
+
+    def export_to_csv(self, file_name, chunk_size=10000):
         """
         Exports the database to a CSV file.
+        - Each table is written as a section: the capitalized table name, its rows and an empty row.
+        - Rows are streamed in chunks, so memory usage does not grow with the table size.
         
         Args:
             file_name (str): The name of the CSV file to export to.
+            chunk_size (int, optional): Number of rows fetched from the database at a time. Defaults to 10000.
         """
-        tables = ["customers", "orders", "products", "suppliers"]
-
         with open(file_name, 'w', newline='', encoding="utf-8") as file:
             writer = csv.writer(file)
-            for table in tables:
+            for table in self.TABLES:
                 writer.writerow([table.capitalize()])
-                self.c.execute(f"SELECT * FROM {table}")
-                records = self.c.fetchall()
-                writer.writerows(records)
+                cursor = self.conn.execute(f"SELECT * FROM {table}")
+                records = cursor.fetchmany(chunk_size)
+                while records:
+                    writer.writerows(records)
+                    records = cursor.fetchmany(chunk_size)
                 writer.writerow([])
 
-    def import_from_csv(self, file_name):
+    def import_from_csv(self, file_name, batch_size=10000, rebuild_indexes=True, workers=1):
         """
         Imports a database from a CSV file.
+        - Recreates the tables and loads the rows of each table section in batches with executemany.
+        - With more than one worker, rows are parsed and converted to the column types by a pool of
+          processes, while this connection remains the single writer.
+        - Runs the whole import in a single transaction, so a failed import leaves the database unchanged.
+        - Optionally drops secondary and full-text indexes before loading and rebuilds them afterwards.
         
         Args:
             file_name (str): The name of the CSV file to import from.
+            batch_size (int, optional): Number of rows inserted per executemany call. Defaults to 10000.
+            rebuild_indexes (bool, optional): Whether to build secondary indexes after the load
+                instead of maintaining them row by row. Defaults to True.
+            workers (int, optional): Number of processes parsing the file. Records must not contain
+                embedded line breaks when greater than 1. Defaults to 1.
         """
-        for table in ["customers", "orders", "products", "suppliers"]:
-            self.c.execute(f"DROP TABLE IF EXISTS {table}")
-        
-        self.create_tables()
-
-        with open(file_name, 'r', encoding="utf-8") as file:
-            reader = csv.reader(file)
-            table = None
-
-            for row in reader:
-                if not row:
-                    continue
-                if row[0].lower() in ["customers", "orders", "products", "suppliers"]:
-                    table = row[0].lower()
-                    continue
-                if table:
-                    if table == "customers":
-                        self.c.execute("INSERT INTO customers (id, name, email, phone, city) VALUES (?, ?, ?, ?, ?)", row)
-                    elif table == "orders":
-                        self.c.execute("INSERT INTO orders (id, customer_id, product_id, date, amount, status) VALUES (?, ?, ?, ?, ?, ?)", row)
-                    elif table == "products":
-                        self.c.execute("INSERT INTO products (id, name, category, price, stock) VALUES (?, ?, ?, ?, ?)", row)
-                    elif table == "suppliers":
-                        self.c.execute("INSERT INTO suppliers (id, name, contact, address, email) VALUES (?, ?, ?, ?, ?)", row)
+        if workers > 1:
+            column_types = {table: self.get_table_schema(table)["affinities"] for table in self.TABLES}
+            self.load_tables(parse_csv_parallel(file_name, column_types, workers), batch_size, rebuild_indexes)
+        else:
+            with open(file_name, 'r', encoding="utf-8") as file:
+                sections = groupby(self.read_csv_sections(csv.reader(file)), key=lambda item: item[0])
+                self.load_tables(((table, (row for _, row in items)) for table, items in sections),
+                                 batch_size, rebuild_indexes)
 
-        self.conn.commit()
+    def populate_synthetic_data(self, orders, customers=None, products=None, suppliers=None, seed=0,
+                                batch_size=10000):
+        """
+        Replaces the contents of the tables with deterministic synthetic data, for performance tests and demos.
+        See datagen.generate_tables for the generated data.
+
+        Args:
+            orders (int): Number of orders.
+            customers (int, optional): Number of customers. Defaults to a tenth of the orders.
+            products (int, optional): Number of products. Defaults to a hundredth of the orders.
+            suppliers (int, optional): Number of suppliers. Defaults to a thousandth of the orders.
+            seed (int, optional): Seed of the random number generator. Defaults to 0.
+            batch_size (int, optional): Number of rows inserted per executemany call. Defaults to 10000.
+        """
+        self.load_tables(generate_tables(orders, customers, products, suppliers, seed), batch_size)
+
+    def load_tables(self, sections, batch_size=10000, rebuild_indexes=True):
+        """
+        Replaces the contents of the tables with the given rows.
+        - Recreates the tables and loads the rows of each section in batches with executemany.
+        - Runs the whole load in a single transaction, so a failed load leaves the database unchanged.
+        - Optionally drops secondary indexes, full-text indexes, column statistics and the customer_orders table
+          before loading and rebuilds them afterwards.
+
+        Args:
+            sections (iterable): Tuples of a table name and an iterable of its rows, including the ID column.
+                A table may appear in several sections.
+            batch_size (int, optional): Number of rows inserted per executemany call. Defaults to 10000.
+            rebuild_indexes (bool, optional): Whether to build secondary indexes after the load
+                instead of maintaining them row by row. Defaults to True.
+        """
+        self.flush()
+        self.c.execute("BEGIN")
+        try:
+            self.drop_search_indexes()
+            self.drop_column_stats()
+            self.drop_customer_orders()
+            for table in self.TABLES:
+                self.c.execute(f"DROP TABLE IF EXISTS {table}")
+
+            self.create_tables()
+            index_definitions = []
+            if rebuild_indexes:
+                index_definitions = self.drop_secondary_indexes()
+                self.drop_search_indexes()
+                self.drop_column_stats()
+                self.drop_customer_orders()
+
+            for table, rows in sections:
+                query = self.get_import_query(table)
+                rows = iter(rows)
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    self.c.executemany(query, batch)
+
+            for sql in index_definitions:
+                self.c.execute(sql)
+            self.create_search_indexes()
+            self.create_column_stats()
+            self.create_customer_orders()
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            self.invalidate_schema()
+            raise
+        for table in self.TABLES:
+            self.records_changed.emit(table, "import", [])
+
+    def read_csv_sections(self, reader):
+        """
+        Reads rows of a sectioned CSV export.
+
+        Args:
+            reader (iterable): Rows of the CSV file, as produced by csv.reader.
+
+        Yields:
+            tuple: The table name and the row, for each data row of the file.
+        """
+        table = None
+        for row in reader:
+            if not row:
+                continue
+            if row[0].lower() in self.TABLES:
+                table = row[0].lower()
+                continue
+            if table:
+                yield table, row
+
+    def get_import_query(self, table):
+        """
+        Builds the INSERT statement used to import rows into a table, including the ID column.
+
+        Args:
+            table (str): The name of the table.
+
+        Returns:
+            str: The INSERT statement.
+        """
+        key = ("import", table)
+        if key not in self.statement_cache:
+            columns = self.get_column_names(table)
+            self.statement_cache[key] = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        return self.statement_cache[key]
+
+    def drop_secondary_indexes(self):
+        """
+        Drops all secondary indexes of the application tables.
+
+        Returns:
+            list: The CREATE INDEX statements of the dropped indexes, to recreate them later.
+        """
+        placeholders = ', '.join(['?'] * len(self.TABLES))
+        self.c.execute(f"""SELECT name, sql FROM sqlite_master
+                           WHERE type='index' AND sql IS NOT NULL AND tbl_name IN ({placeholders})""", self.TABLES)
+        indexes = self.c.fetchall()
+        for name, _ in indexes:
+            self.c.execute(f'DROP INDEX "{name}"')
+        return [sql for _, sql in indexes]
 
     def insert_record(self, table, values):
         """
@@ -222,11 +1136,52 @@ class Database(QObject):
         Args:
             table (str): The name of the table.
             values (tuple): Tuple of values to insert into the table.
+
+        Returns:
+            int: The ID of the new record.
         """
-        placeholders = ', '.join(['?'] * len(values))
-        query = f"INSERT INTO {table} ({', '.join(self.get_column_names(table)[1:])}) VALUES ({placeholders})"
-        self.c.execute(query, values)
-        self.conn.commit()
+        key = ("insert", table)
+        if key not in self.statement_cache:
+            columns = self.get_column_names(table)[1:]
+            self.statement_cache[key] = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        with self.transaction():
+            self.c.execute(self.statement_cache[key], values)
+            record_id = self.c.lastrowid
+            self.record_change(table, "insert", [record_id])
+        return record_id
+
+    def get_table_schema(self, table):
+        """
+        Retrieves the schema of a table from the schema catalog.
+        The catalog reads PRAGMA table_info once per table and is only invalidated by DDL,
+        so inserts and updates do not pay a metadata query each time.
+
+        Args:
+            table (str): The name of the table.
+
+        Returns:
+            dict: Dictionary with the lists of column "names", declared "types", "affinities"
+                (Python type names, as returned by get_type_name) and "nullable" column names.
+        """
+        schema = self.schema_catalog.get(table)
+        if schema is None:
+            info = self.conn.execute(f"PRAGMA table_info({table})").fetchall()
+            schema = {
+                "names": [column[1] for column in info],
+                "types": [column[2] for column in info],
+                "affinities": [get_type_name(column[2]) for column in info],
+                "nullable": [column[1] for column in info if not column[3] and not column[5]],
+            }
+            if info:
+                self.schema_catalog[table] = schema
+        return schema
+
+    def invalidate_schema(self):
+        """
+        Clears the schema catalog and the statements generated from it. Called whenever tables are (re)created.
+        """
+        self.schema_catalog.clear()
+        self.statement_cache.clear()
 
     def get_column_names(self, table):
         """
@@ -238,12 +1193,36 @@ class Database(QObject):
         Returns:
             list: A list of column names.
         """
-        self.c.execute(f"PRAGMA table_info({table})")
-        return [info[1] for info in self.c.fetchall()]
+        return list(self.get_table_schema(table)["names"])
+
+    def get_nullable_columns(self, table):
+        """
+        Retrieves the names of the columns of a table that can contain NULL values.
+        
+        Args:
+            table (str): The name of the table.
+        
+        Returns:
+            list: A list of column names.
+        """
+        return list(self.get_table_schema(table)["nullable"])
+
+    def get_column_types(self, table):
+        """
+        Retrieves declared column types for a given table.
+        
+        Args:
+            table (str): The name of the table.
+        
+        Returns:
+            list: A list of declared column types, in column order.
+        """
+        return list(self.get_table_schema(table)["types"])
 
     def get_column_unique_values(self, table, column):
         """
         Retrieves unique values for a given column in a table.
+        Columns in COLUMN_STATS are read from the column_values table, in ascending order.
         
         Args:
             table (str): The name of the table.
@@ -252,12 +1231,65 @@ class Database(QObject):
         Returns:
             list: A list of unique values in the specified column.
         """
-        self.c.execute(f"SELECT DISTINCT {column} FROM {table}")
+        if column in self.COLUMN_STATS.get(table, []):
+            self.c.execute("SELECT value FROM column_values WHERE table_name=? AND column_name=? ORDER BY value",
+                           (table, column))
+        else:
+            self.c.execute(f"SELECT DISTINCT {column} FROM {table}")
         return [row[0] for row in self.c.fetchall()]
 
+    def get_column_value_counts(self, table, column):
+        """
+        Retrieves the number of rows holding each value of a column in COLUMN_STATS.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The name of the column.
+
+        Returns:
+            list: A list of (value, count) tuples, in ascending order of value.
+        """
+        self.c.execute("SELECT value, count FROM column_values WHERE table_name=? AND column_name=? ORDER BY value",
+                       (table, column))
+        return self.c.fetchall()
+
+    def get_column_facets(self, table, column, prefix="", limit=100):
+        """
+        Retrieves the most frequent values of a column, optionally narrowed to values starting with a prefix.
+        Columns in COLUMN_STATS read the counts maintained in the column_values table:
+        - Without a prefix, the top values are read in order from idx_column_values_count.
+        - With a prefix, the matching values are a range of idx_column_values_prefix, so only they are sorted.
+        Other columns count their values in a single GROUP BY pass.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The name of the column.
+            prefix (str, optional): Only return values whose text starts with the prefix, ignoring case. Defaults to "".
+            limit (int, optional): Maximum number of values returned. Defaults to 100.
+
+        Returns:
+            list: A list of (value, count) tuples, most frequent first.
+        """
+        if column in self.COLUMN_STATS.get(table, []):
+            if not prefix:
+                self.c.execute("""SELECT value, count FROM column_values WHERE table_name=? AND column_name=?
+                                  ORDER BY count DESC, value LIMIT ?""", (table, column, limit))
+            else:
+                # lower() folds ASCII letters only, like LIKE does; char(1114111) is the largest code point.
+                # +count keeps the planner from walking idx_column_values_count past every non-matching value.
+                self.c.execute("""SELECT value, count FROM column_values WHERE table_name=? AND column_name=?
+                                  AND lower(value) >= lower(?) AND lower(value) < lower(?) || char(1114111)
+                                  ORDER BY +count DESC, value LIMIT ?""", (table, column, prefix, prefix, limit))
+        else:
+            pattern = re.sub(r"([\\%_])", r"\\\1", prefix) + "%"
+            self.c.execute(f"""SELECT {column}, COUNT(*) FROM {table} WHERE {column} LIKE ? ESCAPE '\\'
+                               GROUP BY {column} ORDER BY COUNT(*) DESC, {column} LIMIT ?""", (pattern, limit))
+        return self.c.fetchall()
+
     def get_min_max_value(self, table, column):
         """
         Retrieves the minimum and maximum value for a given column in a table.
+        Columns in COLUMN_STATS are read from the column_values table.
         
         Args:
             table (str): The name of the table.
@@ -266,5 +1298,10 @@ class Database(QObject):
         Returns:
             tuple: A tuple containing the minimum and maximum values of the column.
         """
-        self.c.execute(f"SELECT MIN({column}), MAX({column}) FROM {table}")
-        return self.c.fetchone()
\ No newline at end of file
+        if column in self.COLUMN_STATS.get(table, []):
+            self.c.execute("""SELECT (SELECT MIN(value) FROM column_values WHERE table_name=?1 AND column_name=?2),
+                                     (SELECT MAX(value) FROM column_values WHERE table_name=?1 AND column_name=?2)""",
+                           (table, column))
+        else:
+            self.c.execute(f"SELECT MIN({column}), MAX({column}) FROM {table}")
+        return self.c.fetchone()
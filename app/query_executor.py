@@ -0,0 +1,137 @@
+import sqlite3
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+class QueryWorker(QObject):
+    """
+    Worker that runs queries on its own database connection, in the thread it is moved to.
+
+    Attributes:
+        finished (pyqtSignal): Signal emitted with the request ID and the fetched rows.
+        failed (pyqtSignal): Signal emitted with the request ID and the error message.
+        conn (sqlite3.Connection): Connection used by the worker.
+        latest_request_id (int): ID of the most recently submitted request.
+    """
+
+    finished = pyqtSignal(int, list)
+    failed = pyqtSignal(int, str)
+
+    def __init__(self, conn):
+        """
+        Initialize the QueryWorker object.
+
+        Args:
+            conn (sqlite3.Connection): Connection used by the worker.
+        """
+        super().__init__()
+        self.conn = conn
+        self.latest_request_id = 0
+
+    @pyqtSlot(int, str, list)
+    def execute(self, request_id, query, params):
+        """
+        Run a query, unless a newer request has been submitted in the meantime.
+        Any error is reported through the failed signal, as an exception escaping a slot would abort the application.
+
+        Args:
+            request_id (int): ID of the request.
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+        """
+        if request_id != self.latest_request_id:
+            return
+        try:
+            rows = self.conn.execute(query, params).fetchall()
+        except Exception as e:
+            if request_id == self.latest_request_id:
+                self.failed.emit(request_id, str(e) if isinstance(e, sqlite3.Error) else f"{type(e).__name__}: {e}")
+            return
+        self.finished.emit(request_id, rows)
+
+
+class QueryExecutor(QObject):
+    """
+    Runs queries off the GUI thread and delivers only the result of the latest one.
+    - Queries run on a worker thread with its own connection to the database.
+    - Submitting a query interrupts the query still running and drops results of superseded ones.
+
+    Attributes:
+        result_ready (pyqtSignal): Signal emitted with the request ID and the rows of the latest query.
+        query_failed (pyqtSignal): Signal emitted with the request ID and the error message of the latest query.
+        execute_requested (pyqtSignal): Signal queuing a request to the worker thread.
+    """
+
+    result_ready = pyqtSignal(int, list)
+    query_failed = pyqtSignal(int, str)
+    execute_requested = pyqtSignal(int, str, list)
+
+    def __init__(self, db, parent=None):
+        """
+        Initialize the QueryExecutor object and start its worker thread.
+
+        Args:
+            db (Database): Instance of the database class the queries are run against.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.request_id = 0
+        self.thread = QThread()
+        self.worker = QueryWorker(db.connect())
+        self.worker.moveToThread(self.thread)
+        self.execute_requested.connect(self.worker.execute)
+        self.worker.finished.connect(self.handle_finished)
+        self.worker.failed.connect(self.handle_failed)
+        self.thread.start()
+
+    def submit(self, query, params=()):
+        """
+        Submit a query, superseding any query submitted before.
+
+        Args:
+            query (str): The SQL query.
+            params (list, optional): Parameters bound to the query. Defaults to ().
+
+        Returns:
+            int: ID of the request.
+        """
+        self.cancel()
+        self.execute_requested.emit(self.request_id, query, list(params))
+        return self.request_id
+
+    def cancel(self):
+        """
+        Interrupt the running query and drop the results of all submitted queries.
+        """
+        self.request_id += 1
+        self.worker.latest_request_id = self.request_id
+        self.worker.conn.interrupt()
+
+    def is_pending(self, request_id):
+        """
+        Check whether a request is the latest one.
+
+        Args:
+            request_id (int): ID of the request.
+
+        Returns:
+            bool: True if no query was submitted or cancelled after the request.
+        """
+        return request_id == self.request_id
+
+    def handle_finished(self, request_id, rows):
+        if self.is_pending(request_id):
+            self.result_ready.emit(request_id, rows)
+
+    def handle_failed(self, request_id, message):
+        if self.is_pending(request_id):
+            self.query_failed.emit(request_id, message)
+
+    def shutdown(self):
+        """
+        Cancel pending queries, stop the worker thread and close its connection.
+        """
+        if not self.thread.isRunning():
+            return
+        self.cancel()
+        self.thread.quit()
+        self.thread.wait()
+        self.worker.conn.close()
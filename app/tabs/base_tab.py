@@ -1,9 +1,11 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QLabel, QLineEdit, QPushButton, QHBoxLayout, QTableWidgetItem, QDialog,
+    QWidget, QVBoxLayout, QTableView, QLabel, QLineEdit, QPushButton, QHBoxLayout, QDialog,
     QFormLayout, QDialogButtonBox, QInputDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+from ..query_executor import QueryExecutor
 from .filter_window import FilterWindow
+from .table_model import RecordTableModel
 
 class BaseTab(QWidget):
     """
@@ -13,8 +15,17 @@ class BaseTab(QWidget):
         db (Database): Instance of the database class used for database operations.
         columns (list): List of column names for the table.
         filters (dict): Dictionary to store filters applied to the data.
+        sort_column (int): Index of the column the data is sorted by, or None for the key order.
+        sort_descending (bool): Whether the data is sorted in descending order.
+        key_column (str): Name of the query column that uniquely identifies a record.
+        key_index (int): Position of the key column in a record.
+        search_delay (int): Time in milliseconds the search waits for further keystrokes.
     """
 
+    key_column = "id"
+    key_index = 0
+    search_delay = 250
+
     def __init__(self, db, columns):
         """
         Initialize the BaseTab object.
@@ -27,6 +38,13 @@ class BaseTab(QWidget):
         self.db = db
         self.columns = columns
         self.filters = {}
+        self.sort_column = None
+        self.sort_descending = False
+        self.query_executor = None
+        self.pending_fetch = None
+        self.pending_source = None
+        self.pending_limit = None
+        self.loaded_source = None
         self.init_ui()
 
     def init_ui(self):
@@ -35,18 +53,20 @@ class BaseTab(QWidget):
         - Set up the table widget.
         - Set up search and filter functionalities.
         """
-        self.table_widget = QTableWidget()
-        self.table_widget.setSortingEnabled(True)
-        self.table_widget.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-
         layout = QVBoxLayout(self)
-        layout.addWidget(self.table_widget)
-
-        self.table_widget.cellDoubleClicked.connect(self.cell_double_clicked)
+        layout.addWidget(self.create_table_view())
 
         search_label = QLabel("Search:")
         self.search_textbox = QLineEdit()
-        self.search_textbox.textChanged.connect(self.search_data)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.search_delay)
+        self.search_timer.timeout.connect(self.search_data)
+        self.search_textbox.textChanged.connect(self.search_timer.start)
+
+        self.query_executor = QueryExecutor(self.db, self)
+        self.query_executor.result_ready.connect(self.load_search_results)
+        self.query_executor.query_failed.connect(lambda _, message: QMessageBox.warning(self, "Error", message))
 
         self.filter_button = QPushButton("Filter")
         self.filter_button.clicked.connect(self.open_filter_window)
@@ -58,6 +78,24 @@ class BaseTab(QWidget):
 
         layout.addLayout(search_layout)
 
+    def create_table_view(self):
+        """
+        Create the table view and the model that fetches its records on demand.
+
+        Returns:
+            QTableView: The table view.
+        """
+        self.model = RecordTableModel(self.columns, parent=self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table_view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table_view.setSortingEnabled(True)
+        self.model.sort_requested.connect(self.sort_data)
+        self.table_view.doubleClicked.connect(lambda index: self.cell_double_clicked(index.row(), index.column()))
+        return self.table_view
+
     def open_filter_window(self):
         """
         Open the filter window to set filters for the current tab.
@@ -88,18 +126,244 @@ class BaseTab(QWidget):
 
     def load_data(self, records):
         """
-        Load data into the table widget.
+        Load a fixed list of records into the table.
+        Only the rows that differ from the displayed records are inserted, removed or repainted.
 
         Args:
             records (list): List of records to be displayed.
         """
-        self.table_widget.setRowCount(len(records))
-        self.table_widget.setColumnCount(len(self.columns))
-        self.table_widget.setHorizontalHeaderLabels(self.columns)
+        self.model.fetch_records = None
+        self.loaded_source = None
+        self.model.merge_records(records, self.key_index)
+
+    def load_query(self, query, params):
+        """
+        Load the records returned by a query into the table.
+        Records are fetched in batches, as the view scrolls to them.
+
+        Args:
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+        """
+        if self.query_executor:
+            self.query_executor.cancel()
+        self.model.set_source(self.create_record_fetcher(query, params))
+        self.loaded_source = self.get_source(query, params)
+        self.model.fetchMore()
+
+    def get_source(self, query, params):
+        """
+        Get a value identifying the records loaded by a query in the current sort order.
+
+        Args:
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+
+        Returns:
+            tuple: The query, its parameters and the page options.
+        """
+        return query, list(params), self.get_page_options()
+
+    def get_page_options(self):
+        """
+        Get the ordering options of the pages fetched for the current sort order.
+
+        Returns:
+            dict: Keyword arguments for Database.fetch_query_page.
+        """
+        if self.sort_column is None:
+            order_by, descending = self.key_column, False
+        else:
+            order_by, descending = self.get_sort_column(self.sort_column), self.sort_descending
+        return {
+            "key": self.key_column,
+            "order_by": order_by,
+            "descending": descending,
+            "nullable": order_by in self.get_nullable_columns(),
+        }
+
+    def create_record_fetcher(self, query, params):
+        """
+        Create a function fetching the records returned by a query page by page, in the current sort order.
+
+        Args:
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+
+        Returns:
+            callable: Function called with the last fetched record (None for the first page) and the page size.
+        """
+        options = self.get_page_options()
+
+        def fetch_records(last_record, limit):
+            after_key = self.get_keyset_key(last_record) if last_record else None
+            return self.db.fetch_query_page(query, params, after_key, limit, **options)
+
+        return fetch_records
+
+    def get_keyset_key(self, record):
+        """
+        Get the position of a record in the current sort order, as used by keyset pagination.
+
+        Args:
+            record (tuple): The record.
+
+        Returns:
+            The key of the record when sorting by key, otherwise a tuple of its sort value and its key.
+        """
+        if self.sort_column is None:
+            return record[self.key_index]
+        return record[self.sort_column], record[self.key_index]
+
+    def load_search_results(self, request_id, records):
+        """
+        Display the records delivered for the latest search or reload.
+        - A search replaces the displayed records with its first page.
+        - A reload merges the records fetched again into the displayed ones.
+
+        Args:
+            request_id (int): ID of the query request.
+            records (list): Records of the first page, or the records fetched again.
+        """
+        if self.pending_limit is None:
+            self.model.set_source(self.pending_fetch, records)
+        else:
+            self.model.merge_records(records, self.key_index, len(records) == self.pending_limit)
+        self.loaded_source = self.pending_source
+
+    def stop_queries(self):
+        """
+        Cancel the pending search and stop the thread running search queries.
+        """
+        if self.query_executor:
+            self.search_timer.stop()
+            self.query_executor.shutdown()
+
+    def sort_data(self, column, descending):
+        """
+        Sort the data by a column, in the query that fetches it.
+
+        Args:
+            column (int): Index of the column to sort by, or -1 for the key order.
+            descending (bool): Whether to sort in descending order.
+        """
+        self.sort_column = column if column >= 0 else None
+        self.sort_descending = descending
+        self.reload_data()
+
+    def get_sort_column(self, column):
+        """
+        Get the name of the query column displayed in a table column.
+
+        Args:
+            column (int): Index of the table column.
+
+        Returns:
+            str: Name of the query column.
+        """
+        return self.db.get_column_names(self.table_name)[column]
 
-        for row_num, row_data in enumerate(records):
-            for col_num, col_data in enumerate(row_data):
-                self.table_widget.setItem(row_num, col_num, QTableWidgetItem(str(col_data)))
+    def get_nullable_columns(self):
+        """
+        Get the names of the query columns that can contain NULL values.
+
+        Returns:
+            list: List of column names.
+        """
+        return self.db.get_nullable_columns(self.table_name)
+
+    def reload_data(self):
+        """
+        Reload the data displayed in the table, using the current search text and filters.
+        If the query did not change, the rows loaded so far are fetched again off the GUI thread
+        and only the differences are applied once they arrive.
+        Tabs without a search thread fetch them synchronously.
+        """
+        query, params = self.build_search_query()
+        if self.model.fetch_records is None or self.get_source(query, params) != self.loaded_source:
+            self.load_query(query, params)
+            return
+        limit = max(len(self.model.records), self.model.batch_size)
+        if not self.query_executor:
+            records = self.model.fetch_records(None, limit)
+            self.model.merge_records(records, self.key_index, len(records) == limit)
+            return
+        self.submit_query(query, params, limit, merge=True)
+
+    def get_change_columns(self):
+        """
+        Get the query columns that identify the records affected by changes to a table.
+
+        Returns:
+            dict: Dictionary mapping table names to the name and the record position of the column
+                holding the IDs of their records.
+        """
+        return {self.table_name: (self.key_column, self.key_index)}
+
+    def apply_changes(self, table, operation, ids):
+        """
+        Patch the displayed records affected by a committed change, instead of reloading the table.
+        - Deleted records are removed.
+        - Updated records are fetched again and placed by the current sort order, or removed if they no longer
+          match the search.
+        - New matching records are placed by the current sort order among the loaded records,
+          or left to a later batch if they sort after them.
+        - While more records can be fetched, only records sorting within the loaded ones are fetched again.
+        - An import reloads the table.
+
+        Args:
+            table (str): The name of the changed table.
+            operation (str): "insert", "update", "delete" or "import".
+            ids (list): IDs of the affected records.
+        """
+        change_columns = self.get_change_columns()
+        if table not in change_columns:
+            return
+        if operation == "import":
+            self.reload_data()
+            return
+
+        column, column_index = change_columns[table]
+        rows = self.model.find_rows(column_index, ids)
+        if operation == "delete":
+            self.model.remove_rows(rows)
+            return
+
+        # While more records can be fetched, only changes within the loaded records are fetched,
+        # as the others are fetched with a later batch
+        until_key = None
+        if self.model.canFetchMore():
+            if not self.model.rowCount():
+                return
+            until_key = self.get_keyset_key(self.model.record(self.model.rowCount() - 1))
+        query, params = self.build_search_query()
+        fetched_records = self.db.fetch_query_records(query, params, column, ids, until_key=until_key,
+                                                      **self.get_page_options())
+        records = {record[self.key_index]: record for record in fetched_records}
+        self.model.remove_rows([row for row in rows if self.model.record(row)[self.key_index] not in records])
+        self.model.place_records(list(records.values()), self.key_index, self.compare_records)
+
+    def compare_records(self, first, second):
+        """
+        Compare two records in the order the query fetching them sorts them:
+        by the sort column, then by the key, with NULL values before numbers and numbers before text.
+
+        Args:
+            first (tuple): The first record.
+            second (tuple): The second record.
+
+        Returns:
+            int: -1, 0 or 1 if the first record sorts before, with or after the second.
+        """
+        def get_sort_value(value):
+            rank = 0 if value is None else 1 if isinstance(value, (int, float)) else 2 if isinstance(value, str) else 3
+            return rank, value if rank else 0
+
+        sort_index = self.key_index if self.sort_column is None else self.sort_column
+        first_value = get_sort_value(first[sort_index]), get_sort_value(first[self.key_index])
+        second_value = get_sort_value(second[sort_index]), get_sort_value(second[self.key_index])
+        result = (first_value > second_value) - (first_value < second_value)
+        return -result if self.sort_descending and self.sort_column is not None else result
 
     def cell_double_clicked(self, row, column):
         """
@@ -109,8 +373,8 @@ class BaseTab(QWidget):
             row (int): Row index of the clicked cell.
             column (int): Column index of the clicked cell.
         """
-        record_id = self.table_widget.item(row, 0).text()
-        column_name = self.table_widget.horizontalHeaderItem(column).text().lower()
+        record_id = self.model.record(row)[self.key_index]
+        column_name = self.columns[column].lower()
 
         if column_name == "id":
             QMessageBox.warning(self, "Warning", "Editing the primary ID field is not allowed.")
@@ -124,7 +388,6 @@ class BaseTab(QWidget):
         if ok:
             try:
                 self.db.update_record(self.table_name, record_id, column_name, new_value)
-                self.reload_data()
             except ValueError as e:
                 QMessageBox.warning(self, "Error", str(e))
 
@@ -149,23 +412,18 @@ class BaseTab(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             values = [input_widget.text() for input_widget in inputs.values()]
             self.db.insert_record(self.table_name, values)
-            self.reload_data()
 
     def delete_record(self):
         """
         Delete selected records from the table.
         """
-        selected_items = self.table_widget.selectedItems()
-        if not selected_items:
+        selected_rows = self.table_view.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "Warning", f"No {self.entity_name.lower()} selected for deletion")
             return
 
-        for item in selected_items:
-            row = item.row()
-            record_id = self.table_widget.item(row, 0).text()
-            self.db.delete_record(self.table_name, record_id)
-
-        self.reload_data()
+        record_ids = [self.model.record(index.row())[self.key_index] for index in selected_rows]
+        self.db.delete_records(self.table_name, record_ids)
 
     def get_input_dialog_text(self, label_text):
         """
@@ -183,7 +441,7 @@ class BaseTab(QWidget):
         dialog.setOkButtonText("OK")
         dialog.setCancelButtonText("Cancel")
         dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        dialog.setTextValue(self.table_widget.currentItem().text())
+        dialog.setTextValue(self.table_view.currentIndex().data())
            
         text_edit = dialog.findChild(QLineEdit)
         text_edit.returnPressed.connect(dialog.accept)
@@ -213,8 +471,8 @@ class BaseTab(QWidget):
         dialog.setDoubleMaximum(float('inf'))
 
         try:
-            default_value = float(self.table_widget.currentItem().text())
-        except ValueError:
+            default_value = float(self.table_view.currentIndex().data())
+        except (TypeError, ValueError):
             default_value = 0.0
 
         dialog.setDoubleValue(default_value)
@@ -227,8 +485,46 @@ class BaseTab(QWidget):
         else:
             return 0, False
 
+    def build_search_query(self):
+        """
+        Build the query for the data displayed in the table, based on the search text and filters.
+
+        Returns:
+            tuple: Tuple containing the SQL query and the list of its parameters.
+        """
+        return f"SELECT * FROM {self.table_name}", []
+
+    def get_used_indexes(self):
+        """
+        Get the indexes used by the query plan of the current search query.
+
+        Returns:
+            list: Names of the indexes used by the query.
+        """
+        query, params = self.build_search_query()
+        return self.db.get_used_indexes(query, params)
+
     def search_data(self):
         """
         Search data in the table based on the text entered in the search textbox.
+        The first page is fetched off the GUI thread, superseding any search still running.
+        """
+        query, params = self.build_search_query()
+        self.submit_query(query, params, self.model.batch_size)
+
+    def submit_query(self, query, params, limit, merge=False):
+        """
+        Fetch the first records of a query off the GUI thread, superseding any search or reload still running.
+
+        Args:
+            query (str): The SQL query.
+            params (list): Parameters bound to the query.
+            limit (int): Number of records fetched.
+            merge (bool, optional): Whether to merge the records into the displayed ones
+                instead of replacing them. Defaults to False.
         """
-        pass
\ No newline at end of file
+        self.pending_fetch = self.create_record_fetcher(query, params)
+        self.pending_source = self.get_source(query, params)
+        self.pending_limit = limit if merge else None
+        page_query, page_params = self.db.build_query_page(query, params, limit=limit, **self.get_page_options())
+        self.query_executor.submit(page_query, page_params)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from functools import partial
 from .base_tab import BaseTab
 
 class CustomersTab(BaseTab):
@@ -8,29 +9,30 @@ class CustomersTab(BaseTab):
         self.entity_name = "Customer"
         self.reload_data()
 
-    def reload_data(self):
-        records = self.db.fetch_all_customers()
-        self.load_data(records)
-
-    def search_data(self):
-        search_text = self.search_textbox.text()
+    def build_search_query(self):
         filters = self.filters
-        query = "SELECT * FROM customers WHERE name LIKE ?"
-        params = [f"%{search_text}%"]
+        query = "SELECT * FROM customers"
+        conditions = []
+        params = []
+
+        match = self.db.build_match_query(self.search_textbox.text())
+        if match:
+            conditions.append("id IN (SELECT rowid FROM customers_fts WHERE customers_fts MATCH ?)")
+            params.append(match)
 
         city_filters = filters.get("City", {})
         if city_filters.get("enabled", False):
             city = city_filters.get("values", [])
             if city:
-                query += f" AND city IN ({','.join(['?'] * len(city))})"
+                conditions.append(f"city IN ({','.join(['?'] * len(city))})")
                 params.extend(city)
 
-        self.db.c.execute(query, params)
-        records = self.db.c.fetchall()
-        self.load_data(records)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
 
     def get_filter_fields(self):
-        cities = self.db.get_column_unique_values("customers", "city")
+        cities = partial(self.db.get_column_facets, "customers", "city")
         return {"City": cities}
 
     def apply_filters(self, filters):
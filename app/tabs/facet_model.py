@@ -0,0 +1,74 @@
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+class FacetListModel(QAbstractListModel):
+    """
+    Checkable list model showing the values of a filter field with their counts.
+
+    Only the most frequent values, or the most frequent values starting with the typed prefix, are fetched,
+    so the size of the list does not grow with the number of distinct values.
+    Checked values are remembered while the prefix changes, even when they are not displayed.
+
+    Attributes:
+        fetch_values (callable): Function called with a prefix and a limit, returning a list of (value, count) tuples.
+        limit (int): Maximum number of values displayed.
+        values (list): Displayed (value, count) tuples.
+        checked (list): Text of the checked values, in the order they were checked.
+    """
+
+    def __init__(self, fetch_values, checked=None, limit=100, parent=None):
+        """
+        Initialize the FacetListModel object and fetch the most frequent values.
+
+        Args:
+            fetch_values (callable): Function called with a prefix and a limit, returning a list of (value, count) tuples.
+            checked (list, optional): Text of the initially checked values. Defaults to None.
+            limit (int, optional): Maximum number of values displayed. Defaults to 100.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.fetch_values = fetch_values
+        self.limit = limit
+        self.values = []
+        self.checked = list(checked) if checked else []
+        self.set_prefix("")
+
+    def set_prefix(self, prefix):
+        """
+        Replace the displayed values with the most frequent values starting with a prefix.
+
+        Args:
+            prefix (str): The typed prefix.
+        """
+        self.beginResetModel()
+        self.values = list(self.fetch_values(prefix, self.limit))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.values)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        value, count = self.values[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(value) if count is None else f"{value} ({count})"
+        if role == Qt.ItemDataRole.UserRole:
+            return str(value)
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if str(value) in self.checked else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        text = str(self.values[index.row()][0])
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            if text not in self.checked:
+                self.checked.append(text)
+        elif text in self.checked:
+            self.checked.remove(text)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsUserCheckable
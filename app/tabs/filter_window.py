@@ -1,4 +1,6 @@
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QHBoxLayout, QLabel, QListWidget, QCheckBox, QListWidgetItem, QDialogButtonBox, QLineEdit
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QHBoxLayout, QLabel, QListView, QCheckBox, QDialogButtonBox, QLineEdit
+from .facet_model import FacetListModel
 
 class FilterWindow(QDialog):
     """
@@ -6,11 +8,18 @@ class FilterWindow(QDialog):
 
     Attributes:
         filter_fields (dict): Dictionary containing filter fields and their options.
+            - A list of values, or a function called with a prefix and a limit returning (value, count) tuples,
+              is shown as a checkable list narrowed by typing.
+            - A (min, max) tuple is shown as a range.
         prev_filters (dict): Previously applied filters.
         field_widgets (dict): Dictionary to store widgets for each filter field.
         checkboxes (dict): Dictionary to store checkboxes for each filter field.
+        prefix_inputs (dict): Dictionary to store the prefix inputs of the list fields.
+        prefix_delay (int): Time in milliseconds a list waits for further keystrokes before it is narrowed.
     """
 
+    prefix_delay = 200
+
     def __init__(self, parent=None, filter_fields=None, prev_filters=None):
         """
         Initialize FilterWindow.
@@ -26,6 +35,7 @@ class FilterWindow(QDialog):
         self.prev_filters = prev_filters if prev_filters else {}
         self.field_widgets = {}
         self.checkboxes = {}
+        self.prefix_inputs = {}
         self.init_ui()
 
     def init_ui(self):
@@ -48,18 +58,24 @@ class FilterWindow(QDialog):
             field_layout.addStretch(1)
             form_layout.addRow(field_layout)
 
-            if isinstance(options, list):
-                list_widget = QListWidget(self)
-                list_widget.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
-
-                for option in options:
-                    item = QListWidgetItem(str(option))
-                    if str(option) in self.prev_filters.get(field, {}).get("values", []):
-                        item.setSelected(True)
-                    list_widget.addItem(item)
-
-                form_layout.addRow(list_widget)
-                self.field_widgets[field] = list_widget
+            if isinstance(options, list) or callable(options):
+                fetch_values = options if callable(options) else self.create_list_fetcher(options)
+                model = FacetListModel(fetch_values, self.prev_filters.get(field, {}).get("values", []), parent=self)
+                prefix_input = QLineEdit(self)
+                prefix_input.setPlaceholderText("Type to narrow")
+                prefix_timer = QTimer(self)
+                prefix_timer.setSingleShot(True)
+                prefix_timer.setInterval(self.prefix_delay)
+                prefix_timer.timeout.connect(
+                    lambda model=model, prefix_input=prefix_input: model.set_prefix(prefix_input.text()))
+                prefix_input.textChanged.connect(prefix_timer.start)
+                list_view = QListView(self)
+                list_view.setModel(model)
+
+                form_layout.addRow(prefix_input)
+                form_layout.addRow(list_view)
+                self.field_widgets[field] = model
+                self.prefix_inputs[field] = prefix_input
 
             elif isinstance(options, tuple) and len(options) == 2:
                 min_val, max_val = options
@@ -88,6 +104,21 @@ class FilterWindow(QDialog):
 
         layout.addWidget(buttons)
 
+    def create_list_fetcher(self, options):
+        """
+        Create a value fetcher over a fixed list of options, for fields that do not provide counts.
+
+        Args:
+            options (list): List of values.
+
+        Returns:
+            callable: Function called with a prefix and a limit, returning (value, None) tuples.
+        """
+        def fetch_values(prefix, limit):
+            prefix = prefix.lower()
+            return [(option, None) for option in options if str(option).lower().startswith(prefix)][:limit]
+        return fetch_values
+
     def get_filters(self):
         """
         Get the selected filters from the dialog.
@@ -99,10 +130,10 @@ class FilterWindow(QDialog):
 
         for field, widget in self.field_widgets.items():
             if self.checkboxes[field].isChecked():
-                if isinstance(widget, QListWidget):
+                if isinstance(widget, FacetListModel):
                     filters[field] = {
                         "enabled": True,
-                        "values": [item.text() for item in widget.selectedItems()]
+                        "values": list(widget.checked)
                     }
                 elif isinstance(widget, tuple) and len(widget) == 2:
                     min_input, max_input = widget
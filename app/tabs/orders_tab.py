@@ -1,3 +1,4 @@
+from functools import partial
 from .base_tab import BaseTab
 
 class OrdersTab(BaseTab):
@@ -8,16 +9,16 @@ class OrdersTab(BaseTab):
         self.entity_name = "Order"
         self.reload_data()
 
-    def reload_data(self):
-        self.db.c.execute("SELECT * FROM orders")
-        records = self.db.c.fetchall()
-        self.load_data(records)
-
-    def search_data(self):
-        search_text = self.search_textbox.text()
+    def build_search_query(self):
         filters = self.filters
-        query = "SELECT * FROM orders WHERE customer_id IN (SELECT id FROM customers WHERE name LIKE ?)"
-        params = [f"%{search_text}%"]
+        query = "SELECT * FROM orders"
+        conditions = []
+        params = []
+
+        match = self.db.build_match_query(self.search_textbox.text())
+        if match:
+            conditions.append("customer_id IN (SELECT rowid FROM customers_fts WHERE customers_fts MATCH ?)")
+            params.append(match)
 
         customer_filters = filters.get("Customer ID", {})
         product_filters = filters.get("Product ID", {})
@@ -27,35 +28,35 @@ class OrdersTab(BaseTab):
         if customer_filters.get("enabled", False):
             customers = customer_filters.get("values", [])
             if customers:
-                query += f" AND customer_id IN ({','.join(['?'] * len(customers))})"
+                conditions.append(f"customer_id IN ({','.join(['?'] * len(customers))})")
                 params.extend(customers)
 
         if product_filters.get("enabled", False):
             products = product_filters.get("values", [])
             if products:
-                query += f" AND product_id IN ({','.join(['?'] * len(products))})"
+                conditions.append(f"product_id IN ({','.join(['?'] * len(products))})")
                 params.extend(products)
 
         if status_filters.get("enabled", False):
             statuses = status_filters.get("values", [])
             if statuses:
-                query += f" AND status IN ({','.join(['?'] * len(statuses))})"
+                conditions.append(f"status IN ({','.join(['?'] * len(statuses))})")
                 params.extend(statuses)
 
         if amount_filters.get("enabled", False):
             min_amount = amount_filters.get("min", 0)
             max_amount = amount_filters.get("max", float('inf'))
-            query += " AND amount BETWEEN ? AND ?"
+            conditions.append("amount BETWEEN ? AND ?")
             params.extend([min_amount, max_amount])
 
-        self.db.c.execute(query, params)
-        records = self.db.c.fetchall()
-        self.load_data(records)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
 
     def get_filter_fields(self):
-        customers = self.db.get_column_unique_values("orders", "customer_id")
-        products = self.db.get_column_unique_values("orders", "product_id")
-        statuses = self.db.get_column_unique_values("orders", "status")
+        customers = partial(self.db.get_column_facets, "orders", "customer_id")
+        products = partial(self.db.get_column_facets, "orders", "product_id")
+        statuses = partial(self.db.get_column_facets, "orders", "status")
         min_amount, max_amount = self.db.get_min_max_value("orders", "amount")
         return {
             "Customer ID": customers,
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QVBoxLayout, QTableWidget, QLineEdit, QHBoxLayout, QLabel, QDialog, QFormLayout, QDialogButtonBox, QInputDialog, QMessageBox, QTableWidgetItem, QPushButton, QListWidget, QCheckBox, QListWidgetItem
 from PyQt6.QtCore import Qt
 from .filter_window import FilterWindow
+from .diagnostics_window import DiagnosticsWindow
 from .base_tab import BaseTab
 from .customers_tab import CustomersTab
 from .orders_tab import OrdersTab
@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from app.database import Database
+
+
+def summarize(durations):
+    """
+    Summarizes the durations of repeated runs.
+
+    Args:
+        durations (list): Duration of each run in seconds.
+
+    Returns:
+        dict: The median and 95th percentile in seconds, and the number of runs.
+    """
+    p95 = statistics.quantiles(durations, n=20, method="inclusive")[18] if len(durations) > 1 else durations[0]
+    return {"median": statistics.median(durations), "p95": p95, "runs": len(durations)}
+
+
+def time_runs(func, repeat):
+    """
+    Times repeated calls of a function.
+
+    Args:
+        func (callable): Function called with the index of the run.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        list: Duration of each run in seconds.
+    """
+    durations = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        func(run)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def bench_scale(tmp_dir, orders, repeat, write_repeat):
+    """
+    Times the Database operations on a file-backed database filled with synthetic data.
+
+    Args:
+        tmp_dir (str): Directory for the database and CSV files.
+        orders (int): Number of orders; the other tables are scaled as in populate_synthetic_data.
+        repeat (int): Number of timed runs of reads, export and import.
+        write_repeat (int): Number of timed runs of single-record writes.
+
+    Returns:
+        dict: Summary of each operation, as returned by summarize.
+    """
+    path = os.path.join(tmp_dir, f"bench_{orders}.db")
+    csv_file = os.path.join(tmp_dir, f"bench_{orders}.csv")
+    db = Database(path)
+    db.populate_synthetic_data(orders)
+    customers = db.conn.execute("SELECT MAX(id) FROM customers").fetchone()[0]
+
+    benchmarks = {
+        "fetch_all_customers": (repeat, lambda run: db.fetch_all_customers()),
+        "fetch_customer_orders": (repeat, lambda run: db.fetch_customer_orders()),
+        "insert_record": (write_repeat, lambda run: db.insert_record(
+            "orders", (run % customers + 1, 1, "2024-01-01", 1, "W realizacji"))),
+        "update_record": (write_repeat, lambda run: db.update_record("orders", run + 1, "status", "Wysłane")),
+        "delete_record": (write_repeat, lambda run: db.delete_record("orders", orders - run)),
+        "get_column_unique_values": (repeat, lambda run: db.get_column_unique_values("orders", "customer_id")),
+        "get_min_max_value": (repeat, lambda run: db.get_min_max_value("orders", "amount")),
+        "export_to_csv": (repeat, lambda run: db.export_to_csv(csv_file)),
+        "import_from_csv": (repeat, lambda run: db.import_from_csv(csv_file)),
+    }
+    results = {}
+    for name, (runs, func) in benchmarks.items():
+        results[name] = summarize(time_runs(func, runs))
+        print(f"{orders:>9} {name:<26} median {results[name]['median'] * 1000:10.3f} ms"
+              f"  p95 {results[name]['p95'] * 1000:10.3f} ms", flush=True)
+    db.conn.close()
+    return results
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """
+    Compares median durations with a baseline.
+    An operation regressed if its median is both relatively and absolutely slower than the baseline median,
+    so timer noise on sub-millisecond operations is not reported.
+
+    Args:
+        results (dict): Results of this run, mapping scale to operation summaries.
+        baseline (dict): Results of a previous run, in the same format.
+        tolerance (float): Ratio of the median to the baseline median above which an operation regressed.
+        min_delta (float): Difference of the medians in seconds below which an operation did not regress.
+
+    Returns:
+        list: Tuples of (scale, operation, ratio) for the regressed operations.
+    """
+    regressions = []
+    for scale, operations in results.items():
+        for name, summary in operations.items():
+            reference = baseline.get(scale, {}).get(name)
+            if not reference:
+                continue
+            ratio = summary["median"] / reference["median"]
+            print(f"{scale:>9} {name:<26} {ratio:6.2f}x baseline")
+            if ratio > tolerance and summary["median"] - reference["median"] > min_delta:
+                regressions.append((scale, name, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time Database operations at several table sizes.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="numbers of order rows")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs of reads, export and import")
+    parser.add_argument("--write-repeat", type=int, default=50, help="number of timed runs of single-record writes")
+    parser.add_argument("--output", default="bench_database.json", help="JSON file the results are written to")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="ratio to the baseline median above which an operation counts as a regression")
+    parser.add_argument("--min-delta", type=float, default=0.0005,
+                        help="slowdown in seconds below which an operation does not count as a regression")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {str(orders): bench_scale(tmp_dir, orders, args.repeat, args.write_repeat) for orders in args.scales}
+
+    with open(args.output, 'w', encoding="utf-8") as file:
+        json.dump({
+            "environment": {
+                "python": platform.python_version(),
+                "sqlite": sqlite3.sqlite_version,
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+            },
+            "results": results,
+        }, file, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        for scale, name, ratio in regressions:
+            print(f"regression: {name} at {scale} rows is {ratio:.2f}x slower than the baseline")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
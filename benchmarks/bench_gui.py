@@ -0,0 +1,274 @@
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+from app.database import Database
+from app.mainwindow import MainWindow
+from app.tabs.filter_window import FilterWindow
+
+
+def summarize(durations):
+    """
+    Summarizes the latencies of repeated interactions.
+
+    Args:
+        durations (list): Latency of each interaction in seconds.
+
+    Returns:
+        dict: The 50th, 95th and 99th percentiles and the maximum in milliseconds, and the number of interactions.
+    """
+    milliseconds = sorted(duration * 1000 for duration in durations)
+    if len(milliseconds) > 1:
+        percentiles = statistics.quantiles(milliseconds, n=100, method="inclusive")
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = milliseconds[0]
+    return {"p50": p50, "p95": p95, "p99": p99, "max": milliseconds[-1], "count": len(milliseconds)}
+
+
+def get_peak_rss():
+    """
+    Gets the peak resident set size of the process.
+
+    Returns:
+        float: Peak RSS in MiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def wait_for(signal, timeout=10000):
+    """
+    Runs the event loop until a signal is emitted.
+
+    Args:
+        signal (pyqtBoundSignal): The signal to wait for.
+        timeout (int, optional): Maximum time to wait in milliseconds. Defaults to 10000.
+
+    Raises:
+        TimeoutError: If the signal is not emitted in time.
+    """
+    loop = QEventLoop()
+    emitted = []
+
+    def handle_emitted(*args):
+        emitted.append(True)
+        loop.quit()
+
+    signal.connect(handle_emitted)
+    try:
+        QTimer.singleShot(timeout, loop.quit)
+        loop.exec()
+    finally:
+        signal.disconnect(handle_emitted)
+    if not emitted:
+        raise TimeoutError("Timed out waiting for a signal")
+
+
+def search(tab, text):
+    """
+    Types a search text into a tab and waits until the first page of results is displayed.
+
+    Args:
+        tab (BaseTab): The tab.
+        text (str): The search text.
+    """
+    tab.search_textbox.setText(text)
+    tab.search_timer.stop()
+    tab.search_data()
+    wait_for(tab.query_executor.result_ready)
+
+
+def bench_initial_load(path, repeat):
+    """
+    Times opening the main window until all tabs show their first page.
+
+    Args:
+        path (str): Path to the database file.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        list: Latency of each run in seconds.
+    """
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window = MainWindow(path)
+        window.show()
+        QApplication.processEvents()
+        latencies.append(time.perf_counter() - start)
+        window.close()
+        window.deleteLater()
+        QApplication.processEvents()
+    return latencies
+
+
+def bench_search(window, words):
+    """
+    Times the search of the customers tab after each keystroke of typed words.
+
+    Args:
+        window (MainWindow): The main window.
+        words (list): Words typed one letter at a time.
+
+    Returns:
+        list: Latency of each keystroke in seconds.
+    """
+    customers_tab = window.tab_widget.widget(0)
+    window.tab_widget.setCurrentWidget(customers_tab)
+    latencies = []
+    for word in words:
+        for length in range(1, len(word) + 1):
+            start = time.perf_counter()
+            search(customers_tab, word[:length])
+            latencies.append(time.perf_counter() - start)
+    search(customers_tab, "")
+    return latencies
+
+
+def bench_filter(window, repeat):
+    """
+    Times opening the filter dialog of the orders tab and applying a status filter.
+
+    Args:
+        window (MainWindow): The main window.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        tuple: Latencies of opening the dialog and of applying the filter, in seconds.
+    """
+    orders_tab = window.tab_widget.widget(1)
+    window.tab_widget.setCurrentWidget(orders_tab)
+    open_latencies = []
+    apply_latencies = []
+    statuses = ["Wysłane", "Anulowane", "W realizacji"]
+    for run in range(repeat):
+        start = time.perf_counter()
+        filter_window = FilterWindow(orders_tab, orders_tab.get_filter_fields(), orders_tab.filters)
+        open_latencies.append(time.perf_counter() - start)
+        filter_window.deleteLater()
+
+        start = time.perf_counter()
+        orders_tab.apply_filters({"Status": {"enabled": True, "values": [statuses[run % len(statuses)]]}})
+        wait_for(orders_tab.query_executor.result_ready)
+        apply_latencies.append(time.perf_counter() - start)
+    orders_tab.apply_filters({})
+    wait_for(orders_tab.query_executor.result_ready)
+    return open_latencies, apply_latencies
+
+
+def bench_edit(window, repeat):
+    """
+    Times editing a product until the products tab shows the change.
+
+    Args:
+        window (MainWindow): The main window.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        list: Latency of each edit in seconds.
+    """
+    products_tab = window.tab_widget.widget(2)
+    window.tab_widget.setCurrentWidget(products_tab)
+    latencies = []
+    for run in range(repeat):
+        record_id = products_tab.model.record(run % products_tab.model.rowCount())[0]
+        start = time.perf_counter()
+        window.db.update_record("products", record_id, "stock", run)
+        QApplication.processEvents()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_delete(window, repeat):
+    """
+    Times deleting the first order until the orders tab removes it.
+
+    Args:
+        window (MainWindow): The main window.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        list: Latency of each deletion in seconds.
+    """
+    orders_tab = window.tab_widget.widget(1)
+    window.tab_widget.setCurrentWidget(orders_tab)
+    latencies = []
+    for _ in range(repeat):
+        orders_tab.table_view.selectRow(0)
+        start = time.perf_counter()
+        orders_tab.delete_record()
+        QApplication.processEvents()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_scale(tmp_dir, orders, repeat):
+    """
+    Runs the scripted scenarios on a database file filled with synthetic data.
+
+    Args:
+        tmp_dir (str): Directory for the database file.
+        orders (int): Number of orders; the other tables are scaled as in populate_synthetic_data.
+        repeat (int): Number of repetitions of each scenario.
+
+    Returns:
+        dict: Latency summary of each interaction, as returned by summarize, and the peak RSS in MiB.
+    """
+    path = os.path.join(tmp_dir, f"bench_gui_{orders}.db")
+    db = Database(path)
+    db.populate_synthetic_data(orders)
+    db.conn.close()
+
+    results = {"initial_load": summarize(bench_initial_load(path, repeat))}
+    window = MainWindow(path)
+    window.show()
+    QApplication.processEvents()
+    results["search_keystroke"] = summarize(bench_search(window, ["kowal", "nowak", "anna"]))
+    open_latencies, apply_latencies = bench_filter(window, repeat)
+    results["filter_open"] = summarize(open_latencies)
+    results["filter_apply"] = summarize(apply_latencies)
+    results["edit"] = summarize(bench_edit(window, repeat))
+    results["delete"] = summarize(bench_delete(window, repeat))
+    window.close()
+    window.deleteLater()
+    QApplication.processEvents()
+
+    for name, summary in results.items():
+        print(f"{orders:>9} {name:<18} p50 {summary['p50']:9.2f} ms  p95 {summary['p95']:9.2f} ms"
+              f"  max {summary['max']:9.2f} ms", flush=True)
+    results["peak_rss_mib"] = get_peak_rss()
+    print(f"{orders:>9} peak RSS {results['peak_rss_mib']:.1f} MiB", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GUI interaction latencies on an offscreen display.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="numbers of order rows, run in ascending order as peak RSS only grows")
+    parser.add_argument("--repeat", type=int, default=10, help="number of repetitions of each scenario")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {str(orders): bench_scale(tmp_dir, orders, args.repeat) for orders in sorted(args.scales)}
+
+    if args.output:
+        with open(args.output, 'w', encoding="utf-8") as file:
+            json.dump({"platform": app.platformName(), "results": results}, file, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import csv
+import os
+import random
+import statistics
+import tempfile
+import time
+from app.database import Database
+
+
+def write_csv(file_name, rows):
+    """
+    Writes a sectioned CSV export with the given number of orders and a tenth as many customers and products.
+
+    Args:
+        file_name (str): The name of the CSV file.
+        rows (int): Number of orders to write.
+    """
+    rng = random.Random(0)
+    related = max(rows // 10, 1)
+    statuses = ["Wysłane", "W realizacji", "Dostarczone", "Anulowane"]
+
+    with open(file_name, 'w', newline='', encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["Customers"])
+        writer.writerows(
+            (i, f"Klient {i}", f"klient{i}@example.com", f"{rng.randint(100, 999)}-000-000", "Warszawa")
+            for i in range(1, related + 1)
+        )
+        writer.writerow([])
+        writer.writerow(["Orders"])
+        writer.writerows(
+            (i, rng.randint(1, related), rng.randint(1, related), "2023-05-11", rng.randint(1, 5), rng.choice(statuses))
+            for i in range(1, rows + 1)
+        )
+        writer.writerow([])
+        writer.writerow(["Products"])
+        writer.writerows(
+            (i, f"Produkt {i}", "Elektronika", round(rng.uniform(1, 5000), 2), rng.randint(0, 100))
+            for i in range(1, related + 1)
+        )
+        writer.writerow([])
+        writer.writerow(["Suppliers"])
+        writer.writerow([])
+
+
+def time_import(file_name, workers, repeat):
+    """
+    Times import_from_csv into a fresh in-memory database.
+
+    Args:
+        file_name (str): The name of the CSV file.
+        workers (int): Number of parsing processes.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        list: Duration of each run in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        db = Database()
+        start = time.perf_counter()
+        db.import_from_csv(file_name, workers=workers)
+        durations.append(time.perf_counter() - start)
+        db.conn.close()
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare serial and parallel CSV import.")
+    parser.add_argument("--rows", type=int, default=1000000, help="number of order rows")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of parsing processes")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_name = os.path.join(tmp_dir, "import.csv")
+        write_csv(file_name, args.rows)
+        print(f"{args.rows} orders, {os.path.getsize(file_name) / 2 ** 20:.1f} MiB, {os.cpu_count()} CPUs")
+
+        serial = statistics.median(time_import(file_name, 1, args.repeat))
+        parallel = statistics.median(time_import(file_name, args.workers, args.repeat))
+
+    print(f"serial:              {serial:.3f} s")
+    print(f"parallel ({args.workers} workers): {parallel:.3f} s")
+    print(f"speedup:             {serial / parallel:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
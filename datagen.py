@@ -0,0 +1,256 @@
+import argparse
+import random
+from datetime import date
+
+MALE_FIRST_NAMES = [
+    "Adam", "Andrzej", "Bartosz", "Dariusz", "Grzegorz", "Jakub", "Jan", "Kamil", "Krzysztof", "Łukasz",
+    "Marcin", "Marek", "Mateusz", "Michał", "Paweł", "Piotr", "Rafał", "Robert", "Tomasz", "Wojciech",
+]
+FEMALE_FIRST_NAMES = [
+    "Agnieszka", "Aleksandra", "Anna", "Barbara", "Ewa", "Elżbieta", "Joanna", "Julia", "Katarzyna", "Magdalena",
+    "Małgorzata", "Maria", "Marta", "Monika", "Natalia", "Paulina", "Renata", "Zofia", "Żaneta", "Justyna",
+]
+# Surnames as (male form, female form)
+SURNAMES = [
+    ("Nowak", "Nowak"), ("Kowalski", "Kowalska"), ("Wiśniewski", "Wiśniewska"), ("Wójcik", "Wójcik"),
+    ("Kowalczyk", "Kowalczyk"), ("Kamiński", "Kamińska"), ("Lewandowski", "Lewandowska"),
+    ("Zieliński", "Zielińska"), ("Szymański", "Szymańska"), ("Woźniak", "Woźniak"), ("Dąbrowski", "Dąbrowska"),
+    ("Kozłowski", "Kozłowska"), ("Jankowski", "Jankowska"), ("Mazur", "Mazur"), ("Kwiatkowski", "Kwiatkowska"),
+    ("Krawczyk", "Krawczyk"), ("Piotrowski", "Piotrowska"), ("Grabowski", "Grabowska"), ("Nowakowski", "Nowakowska"),
+    ("Pawłowski", "Pawłowska"), ("Michalski", "Michalska"), ("Adamczyk", "Adamczyk"), ("Dudek", "Dudek"),
+    ("Zając", "Zając"), ("Wieczorek", "Wieczorek"), ("Jabłoński", "Jabłońska"), ("Król", "Król"),
+    ("Majewski", "Majewska"), ("Olszewski", "Olszewska"), ("Jaworski", "Jaworska"),
+]
+# Cities as (name, postal code prefix, relative population)
+CITIES = [
+    ("Warszawa", "00", 18), ("Kraków", "30", 8), ("Wrocław", "50", 7), ("Łódź", "90", 7), ("Poznań", "60", 5),
+    ("Gdańsk", "80", 5), ("Szczecin", "70", 4), ("Bydgoszcz", "85", 3), ("Lublin", "20", 3), ("Białystok", "15", 3),
+    ("Katowice", "40", 3), ("Gdynia", "81", 2), ("Częstochowa", "42", 2), ("Radom", "26", 2), ("Toruń", "87", 2),
+    ("Rzeszów", "35", 2), ("Kielce", "25", 2), ("Olsztyn", "10", 2), ("Opole", "45", 1), ("Zielona Góra", "65", 1),
+]
+STREETS = [
+    "Polna", "Leśna", "Słoneczna", "Krótka", "Szkolna", "Ogrodowa", "Lipowa", "Brzozowa", "Łąkowa", "Kwiatowa",
+    "Handlowa", "Przemysłowa", "Kościuszki", "Mickiewicza", "Sienkiewicza", "Piłsudskiego", "Długa", "Parkowa",
+]
+# Categories as (name, product names, minimum price, maximum price)
+CATEGORIES = [
+    ("Elektronika", ["Smartfon", "Tablet", "Słuchawki", "Smartwatch", "Głośnik"], 99.0, 6999.0),
+    ("Komputery", ["Laptop", "Monitor", "Klawiatura", "Mysz", "Drukarka"], 49.0, 9999.0),
+    ("AGD", ["Odkurzacz", "Pralka", "Lodówka", "Zmywarka", "Ekspres do kawy"], 199.0, 5999.0),
+    ("Dom i ogród", ["Zestaw garnków", "Kosiarka", "Grill", "Lampa", "Fotel"], 39.0, 2999.0),
+    ("Sport", ["Rower", "Hulajnoga", "Namiot", "Plecak", "Piłka"], 29.0, 4999.0),
+    ("Zabawki", ["Klocki", "Lalka", "Puzzle", "Gra planszowa", "Samochodzik"], 19.0, 799.0),
+]
+PRODUCT_LINES = ["Basic", "Plus", "Pro", "Max", "Premium", "Eco", "Turbo", "Lite", "XYZ", "Smart"]
+SUPPLIER_SUFFIXES = ["S.A.", "Sp. z o.o.", "sp.j.", "Hurt", "Trade", "Group"]
+SUPPLIER_STEMS = ["Mega", "Top", "Euro", "Pol", "Dom", "Tech", "Agro", "Max", "Net", "Bud"]
+SUPPLIER_TRADES = ["Elektro", "Komputery", "AGD", "Byt", "Sport", "Zabawki", "Handel", "Serwis"]
+# Order statuses with their relative frequency
+STATUSES = [("Dostarczone", 70), ("Wysłane", 12), ("W realizacji", 10), ("Anulowane", 8)]
+EMAIL_DOMAINS = ["gmail.com", "wp.pl", "onet.pl", "o2.pl", "interia.pl", "example.com"]
+ASCII_LETTERS = str.maketrans("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ", "acelnoszzACELNOSZZ")
+
+
+def get_cumulative_weights(weights):
+    """
+    Computes cumulative weights for random.choices.
+
+    Args:
+        weights (list): Relative weights.
+
+    Returns:
+        list: Running totals of the weights.
+    """
+    totals = []
+    total = 0
+    for weight in weights:
+        total += weight
+        totals.append(total)
+    return totals
+
+
+def to_email_name(name):
+    """
+    Converts a name to the local part of an e-mail address.
+
+    Args:
+        name (str): The name, e.g. "Michał Kowalski".
+
+    Returns:
+        str: Lowercase ASCII name with words joined by dots, e.g. "michal.kowalski".
+    """
+    return ".".join(name.translate(ASCII_LETTERS).lower().split())
+
+
+def generate_person(rng):
+    """
+    Generates a random full name.
+
+    Args:
+        rng (random.Random): Random number generator.
+
+    Returns:
+        str: First name and surname, with the surname in the form matching the first name.
+    """
+    male, female = rng.choice(SURNAMES)
+    if rng.random() < 0.5:
+        return f"{rng.choice(MALE_FIRST_NAMES)} {male}"
+    return f"{rng.choice(FEMALE_FIRST_NAMES)} {female}"
+
+
+def generate_phone(rng):
+    """
+    Generates a random mobile phone number.
+
+    Args:
+        rng (random.Random): Random number generator.
+
+    Returns:
+        str: Phone number formatted as "XXX-XXX-XXX".
+    """
+    number = f"{rng.choice('5678')}{rng.randrange(10 ** 8):08d}"
+    return f"{number[:3]}-{number[3:6]}-{number[6:]}"
+
+
+def generate_customers(rng, count):
+    """
+    Generates customers with unique e-mail addresses, spread over cities by population.
+
+    Args:
+        rng (random.Random): Random number generator.
+        count (int): Number of customers.
+
+    Yields:
+        tuple: (id, name, email, phone, city) rows.
+    """
+    cities = [city for city, _, _ in CITIES]
+    city_weights = get_cumulative_weights([population for _, _, population in CITIES])
+    for customer_id in range(1, count + 1):
+        name = generate_person(rng)
+        email = f"{to_email_name(name)}{customer_id}@{rng.choice(EMAIL_DOMAINS)}"
+        city = rng.choices(cities, cum_weights=city_weights)[0]
+        yield customer_id, name, email, generate_phone(rng), city
+
+
+def generate_products(rng, count):
+    """
+    Generates products with names and prices matching their category.
+
+    Args:
+        rng (random.Random): Random number generator.
+        count (int): Number of products.
+
+    Yields:
+        tuple: (id, name, category, price, stock) rows.
+    """
+    for product_id in range(1, count + 1):
+        category, names, min_price, max_price = rng.choice(CATEGORIES)
+        name = f"{rng.choice(names)} {rng.choice(PRODUCT_LINES)} {rng.randrange(100, 10000)}"
+        # Most products are cheap, a few are expensive
+        price = round(min_price + (max_price - min_price) * rng.random() ** 3, 2)
+        yield product_id, name, category, price, rng.randrange(0, 201)
+
+
+def generate_orders(rng, count, customer_count, product_count, start=date(2022, 1, 1), end=date(2024, 12, 31),
+                    block_size=10000):
+    """
+    Generates orders referencing existing customers and products.
+    - A minority of customers and products receives most of the orders.
+    - Statuses follow the frequencies in STATUSES, most orders being delivered.
+
+    Args:
+        rng (random.Random): Random number generator.
+        count (int): Number of orders.
+        customer_count (int): Number of customers, whose IDs run from 1.
+        product_count (int): Number of products, whose IDs run from 1.
+        start (date, optional): Earliest order date. Defaults to 2022-01-01.
+        end (date, optional): Latest order date. Defaults to 2024-12-31.
+        block_size (int, optional): Number of orders drawn at a time. Defaults to 10000.
+
+    Yields:
+        tuple: (id, customer_id, product_id, date, amount, status) rows.
+    """
+    dates = [date.fromordinal(day).isoformat() for day in range(start.toordinal(), end.toordinal() + 1)]
+    statuses = [status for status, _ in STATUSES]
+    status_weights = get_cumulative_weights([weight for _, weight in STATUSES])
+    amounts = [1, 2, 3, 4, 5, 10]
+    amount_weights = get_cumulative_weights([60, 20, 8, 5, 5, 2])
+    random_value = rng.random
+    for block_start in range(1, count + 1, block_size):
+        block = min(block_size, count + 1 - block_start)
+        # Columns are drawn a block at a time, as random.choices is much faster with k than called per row
+        yield from zip(
+            range(block_start, block_start + block),
+            [int(customer_count * random_value() ** 2) + 1 for _ in range(block)],
+            [int(product_count * random_value() ** 3) + 1 for _ in range(block)],
+            rng.choices(dates, k=block),
+            rng.choices(amounts, cum_weights=amount_weights, k=block),
+            rng.choices(statuses, cum_weights=status_weights, k=block),
+        )
+
+
+def generate_suppliers(rng, count):
+    """
+    Generates suppliers with a contact person and a street address.
+
+    Args:
+        rng (random.Random): Random number generator.
+        count (int): Number of suppliers.
+
+    Yields:
+        tuple: (id, name, contact, address, email) rows.
+    """
+    for supplier_id in range(1, count + 1):
+        stem, trade = rng.choice(SUPPLIER_STEMS), rng.choice(SUPPLIER_TRADES)
+        name = f"{stem}{trade} {rng.choice(SUPPLIER_SUFFIXES)}"
+        city, postal_prefix, _ = rng.choice(CITIES)
+        address = (f"ul. {rng.choice(STREETS)} {rng.randrange(1, 200)}, "
+                   f"{postal_prefix}-{rng.randrange(1000):03d} {city}")
+        email = f"kontakt{supplier_id}@{to_email_name(stem + trade)}.pl"
+        yield supplier_id, name, generate_person(rng), address, email
+
+
+def generate_tables(orders, customers=None, products=None, suppliers=None, seed=0):
+    """
+    Generates the rows of all tables, in the order and format of a CSV export.
+    The same arguments always produce the same rows.
+
+    Args:
+        orders (int): Number of orders.
+        customers (int, optional): Number of customers. Defaults to a tenth of the orders.
+        products (int, optional): Number of products. Defaults to a hundredth of the orders.
+        suppliers (int, optional): Number of suppliers. Defaults to a thousandth of the orders.
+        seed (int, optional): Seed of the random number generator. Defaults to 0.
+
+    Yields:
+        tuple: The table name and an iterator over its rows, with IDs.
+    """
+    customers = customers if customers is not None else max(orders // 10, 1)
+    products = products if products is not None else max(orders // 100, 1)
+    suppliers = suppliers if suppliers is not None else max(orders // 1000, 1)
+    rng = random.Random(seed)
+    yield "customers", generate_customers(rng, customers)
+    yield "orders", generate_orders(rng, orders, customers, products)
+    yield "products", generate_products(rng, products)
+    yield "suppliers", generate_suppliers(rng, suppliers)
+
+
+def main():
+    from .database import Database
+
+    parser = argparse.ArgumentParser(description="Create a database file filled with synthetic data.")
+    parser.add_argument("path", help="path of the database file")
+    parser.add_argument("--orders", type=int, default=100000, help="number of orders")
+    parser.add_argument("--customers", type=int, help="number of customers (default: orders / 10)")
+    parser.add_argument("--products", type=int, help="number of products (default: orders / 100)")
+    parser.add_argument("--suppliers", type=int, help="number of suppliers (default: orders / 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    args = parser.parse_args()
+
+    db = Database(args.path)
+    db.populate_synthetic_data(args.orders, args.customers, args.products, args.suppliers, args.seed)
+    db.conn.close()
+
+
+if __name__ == "__main__":
+    main()
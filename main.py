@@ -1,11 +1,22 @@
+import argparse
 import sys
 from PyQt6.QtWidgets import QApplication
 import qdarktheme
 from app.mainwindow import MainWindow
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Database application.")
+    parser.add_argument("db_path", nargs="?", default=":memory:", help="path to the database file")
+    parser.add_argument("--instrument", action="store_true", help="record SQL statistics and show the Diagnostics button")
+    parser.add_argument("--slow-query-log", metavar="PATH",
+                        help="rotating log file of slow statements with their query plans")
+    parser.add_argument("--slow-query-threshold", type=float, default=100, metavar="MS",
+                        help="latency in milliseconds from which a statement is logged")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyleSheet(qdarktheme.load_stylesheet())
-    window = MainWindow()
+    window = MainWindow(args.db_path, instrument=args.instrument, slow_query_log=args.slow_query_log,
+                        slow_query_threshold=args.slow_query_threshold / 1000)
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
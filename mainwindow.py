@@ -2,37 +2,47 @@ from PyQt6.QtWidgets import (
    QMainWindow, QWidget, QVBoxLayout, QTabWidget, QPushButton, QHBoxLayout, QFileDialog
 )
 from .database import Database
-from .tabs.tabs import CustomersTab, OrdersTab, ProductsTab, SuppliersTab, JoinTab
+from .refresh_scheduler import RefreshScheduler
+from .tabs.tabs import CustomersTab, OrdersTab, ProductsTab, SuppliersTab, JoinTab, DiagnosticsWindow
 
 class MainWindow(QMainWindow):
     """
     Main Window class that represents the application's main window.
     """
 
-    def __init__(self):
+    def __init__(self, db_path=":memory:", instrument=False, slow_query_log=None, slow_query_threshold=0.1):
         """
         Initializes the MainWindow object.
         - Sets window title and size.
         - Initializes the database instance.
         - Connects signals to corresponding methods.
         - Creates the tab widget and buttons.
+
+        Args:
+            db_path (str, optional): Path to the database file. Defaults to ":memory:".
+            instrument (bool, optional): Whether to record statement statistics and show the Diagnostics button.
+                Defaults to False.
+            slow_query_log (str, optional): Path to the rotating log file of slow statements. Defaults to None.
+            slow_query_threshold (float, optional): Latency in seconds from which a statement is logged. Defaults to 0.1.
         """
         super().__init__()
         self.setWindowTitle("Database Application")
         self.resize(800, 600)
 
         # Initialize the database instance
-        self.db = Database()
-        # Connect the record_updated signal to the update_join_tab method
-        self.db.record_updated.connect(self.update_join_tab)
-
+        self.db = Database(db_path, instrument=instrument, slow_query_log=slow_query_log,
+                           slow_query_threshold=slow_query_threshold)
         self.tab_widget = QTabWidget()
+        self.refresh_scheduler = RefreshScheduler(self.tab_widget, parent=self)
+        # Connect the records_changed signal to the apply_changes method
+        self.db.records_changed.connect(self.apply_changes)
 
         main_layout = QVBoxLayout()
         main_layout.addWidget(self.tab_widget)
 
         button_layout = QHBoxLayout()
-        for button_text in ["Add", "Delete", "Export", "Import"]:
+        button_texts = ["Add", "Delete", "Export", "Import"] + (["Diagnostics"] if instrument else [])
+        for button_text in button_texts:
             button = QPushButton(button_text)
             button.setFixedWidth(100)
             button_layout.addWidget(button)
@@ -45,6 +55,8 @@ class MainWindow(QMainWindow):
                 button.clicked.connect(self.export_database)
             elif button_text == "Import":
                 button.clicked.connect(self.import_database)
+            elif button_text == "Diagnostics":
+                button.clicked.connect(self.show_diagnostics)
         main_layout.addLayout(button_layout)
 
         central_widget = QWidget()
@@ -75,7 +87,6 @@ class MainWindow(QMainWindow):
         current_tab = self.tab_widget.currentWidget()
         if hasattr(current_tab, "add_record"):
             current_tab.add_record()
-            self.update_join_tab()
 
     def delete_record(self):
         """
@@ -84,7 +95,6 @@ class MainWindow(QMainWindow):
         current_tab = self.tab_widget.currentWidget()
         if hasattr(current_tab, "delete_record"):
             current_tab.delete_record()
-            self.update_join_tab()
 
     def export_database(self):
         """
@@ -97,20 +107,67 @@ class MainWindow(QMainWindow):
     def import_database(self):
         """
         Imports a database from a CSV file.
-        - Clears existing tabs.
+        - Stops and removes existing tabs.
         - Creates tabs again with updated data.
         """
         file_name, _ = QFileDialog.getOpenFileName(self, "Import Database", "", "CSV Files (*.csv)")
         if file_name:
+            self.close_tabs()
             self.db.import_from_csv(file_name)
-            self.tab_widget.clear()
             self.create_tabs()
 
-    def update_join_tab(self):
+    def show_diagnostics(self):
+        """
+        Shows statistics of the SQL statements run so far.
+        """
+        DiagnosticsWindow(self.db, self).exec()
+
+    def close_tabs(self):
         """
-        Updates the JoinTab with the latest data.
+        Stops the search queries of all tabs, drops their pending refreshes and removes them.
+        """
+        self.refresh_scheduler.clear()
+        while self.tab_widget.count():
+            tab = self.tab_widget.widget(0)
+            tab.stop_queries()
+            self.tab_widget.removeTab(0)
+            tab.deleteLater()
+
+    def closeEvent(self, event):
+        """
+        Stops the search queries of all tabs, commits pending writes and closes the slow query log
+        before the window closes.
+
+        Args:
+            event (QCloseEvent): The close event.
         """
         for i in range(self.tab_widget.count()):
-            if isinstance(self.tab_widget.widget(i), JoinTab):
-                self.tab_widget.widget(i).reload_data()
-                break
\ No newline at end of file
+            self.tab_widget.widget(i).stop_queries()
+        self.db.flush()
+        if self.db.slow_query_log:
+            self.db.slow_query_log.close()
+        super().closeEvent(event)
+
+    def get_index_report(self):
+        """
+        Reports the indexes used by the current search query of each tab.
+
+        Returns:
+            dict: Dictionary mapping tab titles to the names of the indexes used by their queries.
+        """
+        return {
+            self.tab_widget.tabText(i): self.tab_widget.widget(i).get_used_indexes()
+            for i in range(self.tab_widget.count())
+        }
+
+    def apply_changes(self, table, operation, ids):
+        """
+        Schedules a refresh of the tabs that show the changed table.
+        The visible tab is patched on the next event-loop tick, hidden tabs when the user switches to them.
+
+        Args:
+            table (str): The name of the changed table.
+            operation (str): "insert", "update", "delete" or "import".
+            ids (list): IDs of the affected records.
+        """
+        self.refresh_scheduler.schedule_changes(table, operation, ids)
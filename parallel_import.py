@@ -0,0 +1,181 @@
+import csv
+import io
+import math
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+def get_type_name(declared_type):
+    """
+    Maps a declared SQLite column type to the name of the Python type stored by its affinity.
+
+    Args:
+        declared_type (str): The declared type of the column, e.g. "INTEGER".
+
+    Returns:
+        str: "int", "float" or "str".
+    """
+    declared_type = declared_type.upper()
+    if "INT" in declared_type:
+        return "int"
+    if "REAL" in declared_type or "FLOA" in declared_type or "DOUB" in declared_type:
+        return "float"
+    return "str"
+
+
+def convert_integer(value):
+    """
+    Converts a CSV field like SQLite stores text in a column with INTEGER affinity.
+    - Integers are stored as int, and reals with an integral value too.
+    - Other reals are stored as float.
+    - Anything else is kept as text.
+
+    Args:
+        value (str): The field.
+
+    Returns:
+        int, float or str: The converted value.
+    """
+    number = convert_real(value)
+    if isinstance(number, float) and number.is_integer() and abs(number) < 2 ** 63:
+        return int(number)
+    return number
+
+
+def convert_real(value):
+    """
+    Converts a CSV field like SQLite stores text in a column with REAL affinity:
+    integers and reals become numbers, anything else is kept as text.
+
+    Args:
+        value (str): The field.
+
+    Returns:
+        int, float or str: The converted value.
+    """
+    # Python also accepts underscores, "nan" and "inf", which SQLite keeps as text
+    if "_" in value:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
+
+def find_chunks(file_name, tables, chunk_bytes):
+    """
+    Splits a sectioned CSV export into byte ranges that never cross a table section.
+    - Section headers are the lines whose first field is a table name.
+    - Every range starts and ends on a line boundary.
+
+    Records must not contain embedded line breaks, as ranges are aligned to physical lines.
+
+    Args:
+        file_name (str): The name of the CSV file.
+        tables (list): Names of the tables that can appear as section headers.
+        chunk_bytes (int): Approximate size of a single range in bytes.
+
+    Returns:
+        list: Tuples of (table, start, end) byte offsets, in file order.
+    """
+    headers = {table.encode("utf-8"): table for table in tables}
+    sections = []
+    table = None
+    start = offset = 0
+
+    with open(file_name, 'rb') as file:
+        for line in file:
+            first_field = line.split(b",", 1)[0].strip().strip(b'"').lower()
+            if first_field in headers:
+                if table:
+                    sections.append((table, start, offset))
+                table = headers[first_field]
+                start = offset + len(line)
+            offset += len(line)
+        if table:
+            sections.append((table, start, offset))
+
+        chunks = []
+        for table, start, end in sections:
+            while start < end:
+                file.seek(min(start + chunk_bytes, end))
+                if file.tell() < end:
+                    file.readline()
+                chunk_end = min(file.tell(), end)
+                chunks.append((table, start, chunk_end))
+                start = chunk_end
+    return chunks
+
+
+def parse_chunk(file_name, start, end, type_names):
+    """
+    Parses and validates the rows of a byte range of a CSV file.
+    Values are converted as SQLite stores text in columns of their affinity, so files the single-process import
+    accepts, e.g. with text or reals in an INTEGER column, load the same way. Empty numeric fields become NULL.
+
+    Args:
+        file_name (str): The name of the CSV file.
+        start (int): Offset of the first byte of the range.
+        end (int): Offset just past the last byte of the range.
+        type_names (list): Python type name of each column, as returned by get_type_name.
+
+    Returns:
+        list: A list of tuples with values converted to the column types.
+
+    Raises:
+        ValueError: If a row has the wrong number of fields.
+    """
+    converters = {"int": convert_integer, "float": convert_real, "str": str}
+    column_converters = [converters[type_name] for type_name in type_names]
+
+    with open(file_name, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start).decode("utf-8")
+
+    rows = []
+    for row in csv.reader(io.StringIO(data, newline='')):
+        if not row:
+            continue
+        if len(row) != len(column_converters):
+            raise ValueError(f"Expected {len(column_converters)} fields, got {len(row)}: {row}")
+        rows.append(tuple(
+            None if value == "" and convert is not str else convert(value)
+            for convert, value in zip(column_converters, row)
+        ))
+    return rows
+
+
+def parse_csv_parallel(file_name, column_types, workers, chunk_bytes=4 * 1024 * 1024):
+    """
+    Parses a sectioned CSV export with a pool of worker processes.
+    - Chunks are parsed concurrently, at most two chunks per worker ahead of the consumer.
+    - Parsed chunks are yielded in file order, so a single writer can insert them.
+
+    Args:
+        file_name (str): The name of the CSV file.
+        column_types (dict): Mapping of table name to the Python type names of its columns.
+        workers (int): Number of worker processes.
+        chunk_bytes (int, optional): Approximate size of a single chunk in bytes. Defaults to 4 MiB.
+
+    Yields:
+        tuple: The table name and a list of typed row tuples.
+    """
+    chunks = find_chunks(file_name, list(column_types), chunk_bytes)
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        pending = deque()
+        for table, start, end in chunks:
+            pending.append((table, executor.submit(parse_chunk, file_name, start, end, column_types[table])))
+            if len(pending) >= 2 * workers:
+                table, future = pending.popleft()
+                yield table, future.result()
+        while pending:
+            table, future = pending.popleft()
+            yield table, future.result()
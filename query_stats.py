@@ -0,0 +1,372 @@
+import logging
+import logging.handlers
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+
+PLANNED_STATEMENTS = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+LATENCY_BUCKETS = [0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf")]
+
+
+def normalize_sql(sql):
+    """
+    Reduces an SQL statement to its shape, so statements differing only in literals are grouped together.
+    - Comments are removed and whitespace is collapsed.
+    - String and number literals are replaced by "?".
+    - Lists of parameters, e.g. "IN (?, ?, ?)", are collapsed to "(...)".
+
+    Args:
+        sql (str): The SQL statement.
+
+    Returns:
+        str: The shape of the statement.
+    """
+    sql = re.sub(r"/\*.*?\*/|--[^\n]*", " ", sql, flags=re.DOTALL)
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])", "?", sql)
+    sql = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(...)", sql)
+    return " ".join(sql.split())
+
+
+class QueryStats:
+    """
+    Thread-safe statistics of the SQL statements run on instrumented connections, grouped by statement shape.
+
+    Attributes:
+        shapes (dict): Statistics of each shape, mapping the shape to a dictionary with the number of executions
+            ("count"), the total and maximum latency in seconds ("total", "max"), the number of executions
+            per latency bucket ("histogram", with upper bounds in LATENCY_BUCKETS) and the rows returned ("rows").
+    """
+
+    def __init__(self):
+        """
+        Initialize the QueryStats object.
+        """
+        self.lock = threading.Lock()
+        self.shapes = {}
+        self.shape_cache = {}
+
+    def record(self, sql, seconds, rows):
+        """
+        Record one execution of a statement.
+
+        Args:
+            sql (str): The SQL statement.
+            seconds (float): Time spent executing the statement and fetching its rows.
+            rows (int): Number of rows returned.
+        """
+        shape = self.shape_cache.get(sql)
+        if shape is None:
+            shape = self.shape_cache[sql] = normalize_sql(sql)
+            if len(self.shape_cache) > 10000:
+                self.shape_cache.clear()
+        bucket = next(i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound)
+        with self.lock:
+            stats = self.shapes.get(shape)
+            if stats is None:
+                stats = self.shapes[shape] = {
+                    "count": 0, "total": 0.0, "max": 0.0, "histogram": [0] * len(LATENCY_BUCKETS), "rows": 0,
+                }
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["histogram"][bucket] += 1
+            stats["rows"] += rows
+
+    def snapshot(self):
+        """
+        Get a copy of the statistics, slowest shapes first.
+
+        Returns:
+            list: Dictionaries with the "shape", the statistics of QueryStats.shapes, the "mean" latency
+                and the "p95" latency, estimated as the upper bound of its histogram bucket.
+        """
+        with self.lock:
+            shapes = [(shape, dict(stats, histogram=list(stats["histogram"]))) for shape, stats in self.shapes.items()]
+        report = []
+        for shape, stats in shapes:
+            stats["shape"] = shape
+            stats["mean"] = stats["total"] / stats["count"]
+            stats["p95"] = self.get_percentile(stats, 0.95)
+            report.append(stats)
+        return sorted(report, key=lambda stats: stats["total"], reverse=True)
+
+    def get_percentile(self, stats, fraction):
+        """
+        Estimate a latency percentile of a shape from its histogram.
+
+        Args:
+            stats (dict): Statistics of the shape.
+            fraction (float): The percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            float: Upper bound in seconds of the bucket holding the percentile, capped at the maximum latency.
+        """
+        threshold = fraction * stats["count"]
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, stats["histogram"]):
+            seen += count
+            if seen >= threshold:
+                return min(bound, stats["max"])
+        return stats["max"]
+
+    def reset(self):
+        """
+        Clear all statistics.
+        """
+        with self.lock:
+            self.shapes.clear()
+
+
+def describe_parameters(params):
+    """
+    Describes the shape of the parameters bound to a statement without their values.
+    Runs of parameters of the same type are collapsed, so long "IN (...)" lists stay readable.
+
+    Args:
+        params (list or dict): Positional or named parameters.
+
+    Returns:
+        str: The number of parameters and their types, e.g. "5: str, int x 4", or "none".
+    """
+    if not params:
+        return "none"
+    if isinstance(params, dict):
+        return f"{len(params)}: " + ", ".join(f"{name}={type(value).__name__}" for name, value in params.items())
+    params = list(params)
+    runs = []
+    for value in params:
+        type_name = type(value).__name__
+        if runs and runs[-1][0] == type_name:
+            runs[-1][1] += 1
+        else:
+            runs.append([type_name, 1])
+    return f"{len(params)}: " + ", ".join(name if count == 1 else f"{name} x {count}" for name, count in runs)
+
+
+def get_query_plan(conn, sql, params):
+    """
+    Gets the EXPLAIN QUERY PLAN output of a statement, indented by the depth of each step.
+    - Only statements reading or writing rows (PLANNED_STATEMENTS) are explained; DDL and PRAGMAs have no plan.
+    - The plan is read on a plain cursor, so it is not recorded as a statement itself.
+
+    Args:
+        conn (sqlite3.Connection): Connection the statement ran on.
+        sql (str): The SQL statement.
+        params (list or dict): Parameters bound to the statement.
+
+    Returns:
+        list: Lines of the plan, empty for other statements, or a single line with the error
+            if the plan cannot be read.
+    """
+    if not sql.lstrip().upper().startswith(PLANNED_STATEMENTS):
+        return []
+    try:
+        rows = conn.cursor(sqlite3.Cursor).execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    except sqlite3.Error as e:
+        return [f"unavailable: {e}"]
+    depths = {0: -1}
+    lines = []
+    for step_id, parent_id, _, detail in rows:
+        depths[step_id] = depths.get(parent_id, -1) + 1
+        lines.append("  " * depths[step_id] + detail)
+    return lines
+
+
+class SlowQueryLog:
+    """
+    Log of the statements taking longer than a threshold, with their query plans, written to a rotating file.
+    Parameter values are not logged, only their types.
+
+    Attributes:
+        threshold (float): Latency in seconds from which a statement is logged.
+        logger (logging.Logger): Logger writing to the file.
+        handler (logging.handlers.RotatingFileHandler): Handler rotating the file.
+    """
+
+    def __init__(self, path, threshold=0.1, max_bytes=1048576, backup_count=3):
+        """
+        Initialize the SlowQueryLog object.
+
+        Args:
+            path (str): Path to the log file.
+            threshold (float, optional): Latency in seconds from which a statement is logged. Defaults to 0.1.
+            max_bytes (int, optional): Size of the file at which it is rotated. Defaults to 1 MiB.
+            backup_count (int, optional): Number of rotated files kept. Defaults to 3.
+        """
+        self.threshold = threshold
+        self.handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger = logging.getLogger(f"{__name__}.slow.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def log(self, conn, sql, params, seconds, rows):
+        """
+        Log a statement with its parameter shapes and query plan, if it took at least the threshold.
+
+        Args:
+            conn (sqlite3.Connection): Connection the statement ran on.
+            sql (str): The SQL statement.
+            params (list or dict): Parameters bound to the statement, or None for executemany.
+            seconds (float): Time spent executing the statement and fetching its rows.
+            rows (int): Number of rows returned.
+        """
+        if seconds < self.threshold:
+            return
+        if params is None:
+            parameters, plan = "executemany", []
+        else:
+            parameters, plan = describe_parameters(params), get_query_plan(conn, sql, params)
+        lines = [
+            f"slow query: {seconds * 1000:.1f} ms, {rows} rows",
+            f"  sql: {' '.join(sql.split())}",
+            f"  parameters: {parameters}",
+        ]
+        if plan:
+            lines.append("  plan:")
+            lines.extend(f"    {line}" for line in plan)
+        self.logger.info("\n".join(lines))
+
+    def close(self):
+        """
+        Flush and close the log file.
+        """
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    Cursor recording the latency and the returned rows of its statements in the QueryStats of its connection.
+    A statement is recorded once its rows are exhausted, or when the cursor runs the next statement or is closed,
+    so the time SQLite spends producing rows while they are fetched is included.
+    Statements taking longer than the threshold of the SlowQueryLog of the connection, if any, are logged.
+
+    A cursor garbage collected before its statement finished only queues the statement on its connection,
+    as recording takes a lock and logging queries the connection; the next statement finished on the
+    connection records it.
+    """
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self.query_stats = conn.query_stats
+        self.slow_query_log = conn.slow_query_log
+        self.abandoned = conn.abandoned
+        self.pending = None
+
+    def execute(self, sql, parameters=()):
+        self.finish_statement()
+        start = time.perf_counter()
+        super().execute(sql, parameters)
+        self.pending = [sql, time.perf_counter() - start, 0, parameters]
+        if self.description is None:
+            self.finish_statement()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self.finish_statement()
+        start = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        seconds = time.perf_counter() - start
+        self.query_stats.record(sql, seconds, 0)
+        if self.slow_query_log:
+            self.slow_query_log.log(self.connection, sql, None, seconds, 0)
+        return self
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self.add_fetch_time(start, 0 if row is None else 1, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self.add_fetch_time(start, len(rows), len(rows) < (self.arraysize if size is None else size))
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self.add_fetch_time(start, len(rows), True)
+        return rows
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self):
+        self.finish_statement()
+        super().close()
+
+    def __del__(self):
+        pending = getattr(self, "pending", None)
+        if pending:
+            self.abandoned.append(pending)
+
+    def add_fetch_time(self, start, rows, exhausted):
+        """
+        Add the time spent fetching rows to the pending statement.
+
+        Args:
+            start (float): Value of time.perf_counter() before fetching.
+            rows (int): Number of fetched rows.
+            exhausted (bool): Whether all rows of the statement were fetched.
+        """
+        if self.pending:
+            self.pending[1] += time.perf_counter() - start
+            self.pending[2] += rows
+            if exhausted:
+                self.finish_statement()
+
+    def finish_statement(self):
+        """
+        Record the pending statement and the statements abandoned on the connection, and log the slow ones.
+        """
+        statements = []
+        if self.pending:
+            statements.append(self.pending)
+            self.pending = None
+        while self.abandoned:
+            try:
+                statements.append(self.abandoned.popleft())
+            except IndexError:
+                break
+        for sql, seconds, rows, parameters in statements:
+            self.query_stats.record(sql, seconds, rows)
+            if self.slow_query_log:
+                self.slow_query_log.log(self.connection, sql, parameters, seconds, rows)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """
+    Connection whose cursors record statement statistics, for sqlite3.connect(factory=...).
+
+    Attributes:
+        query_stats (QueryStats): Statistics the cursors record into. Must be set before the connection is used.
+        slow_query_log (SlowQueryLog): Log of the slow statements, or None to not log them.
+        abandoned (collections.deque): Unfinished statements of garbage collected cursors, waiting to be recorded.
+    """
+
+    query_stats = None
+    slow_query_log = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.abandoned = deque()
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -0,0 +1,88 @@
+from PyQt6.QtCore import QObject, QTimer
+
+class RefreshScheduler(QObject):
+    """
+    Coalesces the refreshes of the tabs of a tab widget.
+    - Changes are collected per tab and applied at most once per event-loop tick.
+    - Hidden tabs are refreshed only when the user switches to them.
+    - Tabs with an import or too many changed records pending are reloaded once instead of patched.
+
+    Attributes:
+        tab_widget (QTabWidget): The tab widget whose tabs are refreshed.
+        max_patch_ids (int): Number of pending changed records above which a tab is reloaded instead of patched.
+        pending (dict): Pending refresh of each tab, mapping the tab to None for a reload,
+            or to a dictionary mapping (table, operation) to the changed IDs.
+    """
+
+    def __init__(self, tab_widget, max_patch_ids=1000, parent=None):
+        """
+        Initialize the RefreshScheduler object.
+
+        Args:
+            tab_widget (QTabWidget): The tab widget whose tabs are refreshed.
+            max_patch_ids (int, optional): Number of pending changed records above which a tab is reloaded
+                instead of patched. Defaults to 1000.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.max_patch_ids = max_patch_ids
+        self.pending = {}
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.refresh_current_tab)
+        self.tab_widget.currentChanged.connect(self.refresh_current_tab)
+
+    def schedule_changes(self, table, operation, ids):
+        """
+        Mark the tabs showing a changed table as dirty.
+
+        Args:
+            table (str): The name of the changed table.
+            operation (str): "insert", "update", "delete" or "import".
+            ids (list): IDs of the affected records.
+        """
+        for i in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(i)
+            if table not in tab.get_change_columns():
+                continue
+            if operation == "import":
+                self.pending[tab] = None
+            elif tab not in self.pending or self.pending[tab] is not None:
+                changes = self.pending.setdefault(tab, {})
+                changes.setdefault((table, operation), {}).update(dict.fromkeys(ids))
+                if sum(len(changed_ids) for changed_ids in changes.values()) > self.max_patch_ids:
+                    self.pending[tab] = None
+        self.timer.start()
+
+    def schedule_reload(self, tab):
+        """
+        Mark a tab for a full reload.
+
+        Args:
+            tab (BaseTab): The tab to reload.
+        """
+        self.pending[tab] = None
+        self.timer.start()
+
+    def refresh_current_tab(self):
+        """
+        Apply the pending refresh of the visible tab.
+        """
+        tab = self.tab_widget.currentWidget()
+        if tab not in self.pending:
+            return
+        changes = self.pending.pop(tab)
+        if changes is None:
+            tab.reload_data()
+            return
+        for (table, operation), ids in changes.items():
+            tab.apply_changes(table, operation, list(ids))
+
+    def clear(self):
+        """
+        Drop all pending refreshes, e.g. when the tabs are removed.
+        """
+        self.timer.stop()
+        self.pending.clear()
@@ -0,0 +1,72 @@
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QHeaderView
+from PyQt6.QtCore import Qt
+
+class DiagnosticsWindow(QDialog):
+    """
+    Dialog window showing statistics of the SQL statements run by the application, grouped by statement shape.
+
+    Attributes:
+        db (Database): Instance of the database class, with instrumentation enabled.
+        table (QTableWidget): Table listing the statistics, slowest shapes first.
+    """
+
+    COLUMNS = ["Statement", "Count", "Total (ms)", "Mean (ms)", "p95 (ms)", "Max (ms)", "Rows"]
+
+    def __init__(self, db, parent=None):
+        """
+        Initialize DiagnosticsWindow.
+
+        Args:
+            db (Database): Instance of the database class, with instrumentation enabled.
+            parent (QWidget, optional): Parent widget. Defaults to None.
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Query Diagnostics")
+        self.resize(900, 500)
+        self.db = db
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        """
+        Initialize the user interface of the diagnostics dialog.
+        """
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        for button_text, slot in [("Refresh", self.refresh), ("Reset", self.reset), ("Close", self.accept)]:
+            button = QPushButton(button_text)
+            button.clicked.connect(slot)
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        """
+        Show the current statistics.
+        """
+        stats = self.db.get_query_stats()
+        self.table.setRowCount(len(stats))
+        for row, shape_stats in enumerate(stats):
+            values = [
+                shape_stats["shape"], shape_stats["count"], shape_stats["total"] * 1000, shape_stats["mean"] * 1000,
+                shape_stats["p95"] * 1000, shape_stats["max"] * 1000, shape_stats["rows"],
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(f"{value:.3f}" if isinstance(value, float) else str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                else:
+                    item.setToolTip(value)
+                self.table.setItem(row, column, item)
+
+    def reset(self):
+        """
+        Clear the statistics.
+        """
+        self.db.reset_query_stats()
+        self.refresh()
@@ -2,6 +2,10 @@ from .base_tab import BaseTab
 from PyQt6.QtWidgets import QMessageBox
 
 class JoinTab(BaseTab):
+    key_column = "order_id"
+    key_index = 6
+    sort_columns = ["customer_id", "customer_name", "order_date", "order_amount", "product_name", "product_price"]
+
     def __init__(self, db):
         columns = ["Customer ID", "Customer Name", "Order Date", "Order Amount", "Product Name", "Product Price"]
         super().__init__(db, columns)
@@ -9,21 +13,20 @@ class JoinTab(BaseTab):
         self.entity_name = "Customer Order"
         self.reload_data()
 
-    def reload_data(self):
-        records = self.db.fetch_customer_orders()
-        self.load_data(records)
-
-    def search_data(self):
-        search_text = self.search_textbox.text()
+    def build_search_query(self):
         filters = self.filters
         query = '''
-            SELECT customers.id, customers.name, orders.date, orders.amount, products.name, products.price
-            FROM customers
-            JOIN orders ON customers.id = orders.customer_id
-            JOIN products ON orders.product_id = products.id
-            WHERE customers.name LIKE ?
+            SELECT customer_id, customer_name, order_date, order_amount, product_name, product_price, order_id,
+                   product_id
+            FROM customer_orders
         '''
-        params = [f"%{search_text}%"]
+        conditions = []
+        params = []
+
+        match = self.db.build_match_query(self.search_textbox.text())
+        if match:
+            conditions.append("customer_id IN (SELECT rowid FROM customers_fts WHERE customers_fts MATCH ?)")
+            params.append(match)
 
         amount_filters = filters.get("Order Amount", {})
         price_filters = filters.get("Product Price", {})
@@ -31,18 +34,27 @@ class JoinTab(BaseTab):
         if amount_filters.get("enabled", False):
             min_amount = amount_filters.get("min", 0)
             max_amount = amount_filters.get("max", float('inf'))
-            query += " AND orders.amount BETWEEN ? AND ?"
+            conditions.append("order_amount BETWEEN ? AND ?")
             params.extend([min_amount, max_amount])
 
         if price_filters.get("enabled", False):
             min_price = price_filters.get("min", 0)
             max_price = price_filters.get("max", float('inf'))
-            query += " AND products.price BETWEEN ? AND ?"
+            conditions.append("product_price BETWEEN ? AND ?")
             params.extend([min_price, max_price])
 
-        self.db.c.execute(query, params)
-        records = self.db.c.fetchall()
-        self.load_data(records)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
+
+    def get_sort_column(self, column):
+        return self.sort_columns[column]
+
+    def get_nullable_columns(self):
+        return []
+
+    def get_change_columns(self):
+        return {"customers": ("customer_id", 0), "orders": ("order_id", 6), "products": ("product_id", 7)}
 
     def get_filter_fields(self):
         min_amount, max_amount = self.db.get_min_max_value("orders", "amount")
@@ -1,3 +1,4 @@
+from functools import partial
 from .base_tab import BaseTab
 
 class ProductsTab(BaseTab):
@@ -8,16 +9,16 @@ class ProductsTab(BaseTab):
         self.entity_name = "Product"
         self.reload_data()
 
-    def reload_data(self):
-        self.db.c.execute("SELECT * FROM products")
-        records = self.db.c.fetchall()
-        self.load_data(records)
-
-    def search_data(self):
-        search_text = self.search_textbox.text()
+    def build_search_query(self):
         filters = self.filters
-        query = "SELECT * FROM products WHERE name LIKE ?"
-        params = [f"%{search_text}%"]
+        query = "SELECT * FROM products"
+        conditions = []
+        params = []
+
+        match = self.db.build_match_query(self.search_textbox.text())
+        if match:
+            conditions.append("id IN (SELECT rowid FROM products_fts WHERE products_fts MATCH ?)")
+            params.append(match)
 
         category_filters = filters.get("Category", {})
         price_filters = filters.get("Price", {})
@@ -26,27 +27,27 @@ class ProductsTab(BaseTab):
         if category_filters.get("enabled", False):
             categories = category_filters.get("values", [])
             if categories:
-                query += f" AND category IN ({','.join(['?'] * len(categories))})"
+                conditions.append(f"category IN ({','.join(['?'] * len(categories))})")
                 params.extend(categories)
 
         if price_filters.get("enabled", False):
             min_price = price_filters.get("min", 0)
             max_price = price_filters.get("max", float('inf'))
-            query += " AND price BETWEEN ? AND ?"
+            conditions.append("price BETWEEN ? AND ?")
             params.extend([min_price, max_price])
 
         if stock_filters.get("enabled", False):
             min_stock = stock_filters.get("min", 0)
             max_stock = stock_filters.get("max", float('inf'))
-            query += " AND stock BETWEEN ? AND ?"
+            conditions.append("stock BETWEEN ? AND ?")
             params.extend([min_stock, max_stock])
 
-        self.db.c.execute(query, params)
-        records = self.db.c.fetchall()
-        self.load_data(records)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
 
     def get_filter_fields(self):
-        categories = self.db.get_column_unique_values("products", "category")
+        categories = partial(self.db.get_column_facets, "products", "category")
         min_price, max_price = self.db.get_min_max_value("products", "price")
         min_stock, max_stock = self.db.get_min_max_value("products", "stock")
         return {"Category": categories, "Price": (min_price, max_price), "Stock": (min_stock, max_stock)}
@@ -1,5 +1,5 @@
 from .base_tab import BaseTab
-from PyQt6.QtWidgets import QVBoxLayout, QTableWidget
+from PyQt6.QtWidgets import QVBoxLayout
 
 class SuppliersTab(BaseTab):
     def __init__(self, db):
@@ -10,16 +10,5 @@ class SuppliersTab(BaseTab):
         self.reload_data()
 
     def init_ui(self):
-        self.table_widget = QTableWidget()
-        self.table_widget.setSortingEnabled(True)
-        self.table_widget.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-
         layout = QVBoxLayout(self)
-        layout.addWidget(self.table_widget)
-
-        self.table_widget.cellDoubleClicked.connect(self.cell_double_clicked)
-
-    def reload_data(self):
-        self.db.c.execute("SELECT * FROM suppliers")
-        records = self.db.c.fetchall()
-        self.load_data(records)
\ No newline at end of file
+        layout.addWidget(self.create_table_view())
\ No newline at end of file
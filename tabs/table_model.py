@@ -0,0 +1,234 @@
+from bisect import bisect_left
+from functools import cmp_to_key
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Table model that fetches records from the database on demand.
+
+    Only rows the view asks for through canFetchMore and fetchMore are materialized,
+    so memory usage and rendering time do not grow with the size of the table.
+
+    Attributes:
+        sort_requested (pyqtSignal): Signal emitted with the column index (-1 for the natural order)
+            and whether the order is descending, when the view asks to sort the records.
+        columns (list): List of column names displayed in the header.
+        batch_size (int): Number of records fetched at a time.
+        records (list): Records fetched so far.
+    """
+
+    sort_requested = pyqtSignal(int, bool)
+
+    def __init__(self, columns, batch_size=200, parent=None):
+        """
+        Initialize the RecordTableModel object.
+
+        Args:
+            columns (list): List of column names displayed in the header.
+            batch_size (int, optional): Number of records fetched at a time. Defaults to 200.
+            parent (QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.columns = columns
+        self.batch_size = batch_size
+        self.records = []
+        self.fetch_records = None
+        self.has_more = False
+
+    def set_source(self, fetch_records, records=None):
+        """
+        Replace the displayed records with records fetched on demand.
+
+        Args:
+            fetch_records (callable): Function called with the last fetched record (None for the first batch)
+                and the batch size, returning the next records.
+            records (list, optional): First batch of records, if already fetched. Defaults to None.
+        """
+        self.beginResetModel()
+        self.records = list(records) if records is not None else []
+        self.fetch_records = fetch_records
+        self.has_more = records is None or len(records) == self.batch_size
+        self.endResetModel()
+
+    def set_records(self, records):
+        """
+        Replace the displayed records with a fixed list of records.
+
+        Args:
+            records (list): List of records to be displayed.
+        """
+        self.beginResetModel()
+        self.records = list(records)
+        self.fetch_records = None
+        self.has_more = False
+        self.endResetModel()
+
+    def record(self, row):
+        """
+        Get the record displayed in a row.
+
+        Args:
+            row (int): Row index.
+
+        Returns:
+            tuple: The record.
+        """
+        return self.records[row]
+
+    def merge_records(self, records, key_index, has_more=False):
+        """
+        Replace the displayed records with a new list of records, changing only the rows that differ.
+        Rows are matched by key, so unchanged rows are not repainted and the view keeps its position and selection.
+
+        Args:
+            records (list): The new list of records.
+            key_index (int): Position of the key in a record.
+            has_more (bool, optional): Whether more records can be fetched after them. Defaults to False.
+        """
+        keys = {record[key_index] for record in records}
+        self.remove_rows([row for row, record in enumerate(self.records) if record[key_index] not in keys])
+
+        # Rows before the current one are final, and the old rows not placed yet follow them in their old order,
+        # so the current position of an old row is found by counting the old rows placed before it in a Fenwick tree
+        old_rows = {record[key_index]: old_row for old_row, record in enumerate(self.records)}
+        placed = [0] * (len(self.records) + 1)
+        for row, record in enumerate(records):
+            old_row = old_rows.get(record[key_index])
+            if old_row is None:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.records.insert(row, record)
+                self.endInsertRows()
+                continue
+            index, placed_before = old_row, 0
+            while index:
+                placed_before += placed[index]
+                index -= index & -index
+            source = row + old_row - placed_before
+            if source != row:
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+                self.records.insert(row, self.records.pop(source))
+                self.endMoveRows()
+            index = old_row + 1
+            while index < len(placed):
+                placed[index] += 1
+                index += index & -index
+            old_record = self.records[row]
+            changed = [column for column in range(len(self.columns)) if old_record[column] != record[column]]
+            self.records[row] = record
+            if changed:
+                self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+        self.has_more = has_more
+
+    def find_rows(self, column, values):
+        """
+        Find the rows whose record holds one of the given values in a column.
+
+        Args:
+            column (int): Position of the value in a record.
+            values (list): Values to look for.
+
+        Returns:
+            list: Row indexes, in ascending order.
+        """
+        values = set(values)
+        return [row for row, record in enumerate(self.records) if record[column] in values]
+
+    def replace_record(self, row, record):
+        """
+        Replace the record displayed in a row.
+
+        Args:
+            row (int): Row index.
+            record (tuple): The new record.
+        """
+        self.records[row] = record
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+
+    def place_records(self, records, key_index, compare):
+        """
+        Insert or replace records at the positions given by the sort order of the displayed records.
+        - A displayed record still sorting between its neighbors is replaced in place.
+        - Other records are removed and inserted at their position, found by binary search.
+        - A record sorting after the last displayed one is left out while more records can be fetched,
+          as it is fetched with a later batch.
+
+        Args:
+            records (list): The records.
+            key_index (int): Position of the key in a record.
+            compare (callable): Function comparing two records, returning a negative number, zero
+                or a positive number if the first sorts before, with or after the second.
+        """
+        rows = {record[key_index]: row for row, record in enumerate(self.records)}
+        placed = []
+        moved_rows = set()
+        for row, record in sorted(((rows[record[key_index]], record) for record in records
+                                   if record[key_index] in rows), key=lambda item: item[0]):
+            # Rows to the left are final, rows to the right still hold their old, sorted records
+            left = row - 1
+            while left in moved_rows:
+                left -= 1
+            if (left < 0 or compare(self.records[left], record) <= 0) and \
+                    (row + 1 == len(self.records) or compare(record, self.records[row + 1]) <= 0):
+                self.replace_record(row, record)
+            else:
+                moved_rows.add(row)
+                placed.append(record)
+        self.remove_rows(moved_rows)
+        placed.extend(record for record in records if record[key_index] not in rows)
+
+        sort_key = cmp_to_key(compare)
+        for record in placed:
+            position = bisect_left(self.records, sort_key(record), key=sort_key)
+            if position == len(self.records) and self.has_more:
+                continue
+            self.beginInsertRows(QModelIndex(), position, position)
+            self.records.insert(position, record)
+            self.endInsertRows()
+
+    def remove_rows(self, rows):
+        """
+        Remove rows, keeping the other records and the position of the view.
+
+        Args:
+            rows (list): Row indexes.
+        """
+        for row in sorted(rows, reverse=True):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.records[row]
+            self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return str(self.records[index.row()][index.column()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.columns[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        # Records are sorted by the query that fetches them, as only part of them is loaded
+        self.sort_requested.emit(column, order == Qt.SortOrder.DescendingOrder)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self.has_more:
+            return
+        last_record = self.records[-1] if self.records else None
+        records = self.fetch_records(last_record, self.batch_size)
+        self.has_more = len(records) == self.batch_size
+        if records:
+            self.beginInsertRows(QModelIndex(), len(self.records), len(self.records) + len(records) - 1)
+            self.records.extend(records)
+            self.endInsertRows()
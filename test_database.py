@@ -2,7 +2,10 @@ import unittest
 import sqlite3
 import csv
 import os
-from .database import Database
+import tempfile
+from .database import Database, normalize_text
+from .parallel_import import find_chunks, parse_chunk
+from .query_stats import describe_parameters, normalize_sql
 
 class TestDatabase(unittest.TestCase):
     def setUp(self):
@@ -20,16 +23,198 @@ class TestDatabase(unittest.TestCase):
         orders = self.db.fetch_customer_orders()
         self.assertEqual(len(orders), 4)
 
+    def assert_customer_orders_match_join(self):
+        expected = self.db.conn.execute('''SELECT orders.id, customers.id, customers.name, orders.date, orders.amount,
+                                                    products.id, products.name, products.price
+                                             FROM orders
+                                             JOIN customers ON customers.id = orders.customer_id
+                                             JOIN products ON products.id = orders.product_id
+                                             ORDER BY orders.id''').fetchall()
+        actual = self.db.conn.execute("SELECT * FROM customer_orders ORDER BY order_id").fetchall()
+        self.assertEqual(actual, expected)
+
+    def test_customer_orders_follow_changes(self):
+        self.db.update_record('customers', 1, 'name', 'Jan Kowalski')
+        self.db.update_record('products', 2, 'price', 10.0)
+        self.db.update_record('orders', 3, 'product_id', 1)
+        self.db.update_record('orders', 4, 'customer_id', 99)
+        self.assert_customer_orders_match_join()
+        self.db.delete_record('customers', 2)
+        self.db.insert_record('orders', (3, 2, '2023-06-01', 2, 'Wysłane'))
+        self.db.insert_record('customers', ('Adam Nowicki', 'adam@example.com', '123-456-789', 'Poznań'))
+        self.db.update_record('orders', 4, 'customer_id', 5)
+        self.assert_customer_orders_match_join()
+        self.assertEqual(self.db.fetch_customer_orders()[0][1], 'Jan Kowalski')
+
+    def test_import_from_csv_rebuilds_customer_orders(self):
+        self.db.export_to_csv('test.csv')
+        self.db.delete_record('orders', 1)
+        self.db.import_from_csv('test.csv')
+        os.remove('test.csv')
+        self.assertEqual(len(self.db.fetch_customer_orders()), 4)
+        self.assert_customer_orders_match_join()
+        self.assertIn('idx_customer_orders_customer_id', self.db.get_indexes('customer_orders'))
+
+    def test_fetch_page(self):
+        first_page = self.db.fetch_page('customers', limit=3)
+        self.assertEqual([row[0] for row in first_page], [1, 2, 3])
+        second_page = self.db.fetch_page('customers', after_key=first_page[-1][0], limit=3)
+        self.assertEqual([row[0] for row in second_page], [4])
+
+        by_name = self.db.fetch_page('customers', limit=2, order_by='name', descending=True)
+        self.assertEqual([row[1] for row in by_name], ['Piotr Wiśniewski', 'Michał Kowalski'])
+        after_key = (by_name[-1][1], by_name[-1][0])
+        by_name = self.db.fetch_page('customers', after_key=after_key, limit=2, order_by='name', descending=True)
+        self.assertEqual([row[1] for row in by_name], ['Katarzyna Wójcik', 'Anna Nowak'])
+
+        orders = self.db.fetch_page('orders', filters={'status': ['Wysłane', 'Anulowane'], 'amount': {'min': 2}})
+        self.assertEqual([row[0] for row in orders], [4])
+
+        with self.assertRaises(ValueError):
+            self.db.fetch_page('customers', order_by='name; DROP TABLE customers')
+
+    def test_fetch_page_with_null_values(self):
+        self.db.c.execute("INSERT INTO orders (customer_id, product_id, date, amount, status) VALUES (NULL, 1, '2023-07-01', 1, 'Wysłane')")
+        for descending in [False, True]:
+            ids = []
+            after_key = None
+            while True:
+                page = self.db.fetch_page('orders', after_key=after_key, limit=2, order_by='customer_id', descending=descending)
+                if not page:
+                    break
+                ids.extend(row[0] for row in page)
+                after_key = (page[-1][1], page[-1][0])
+            self.assertEqual(ids, [3, 4, 2, 1, 5] if descending else [5, 1, 2, 4, 3])
+
+    def test_fetch_query_page(self):
+        query = "SELECT customers.name AS customer_name, orders.id AS order_id FROM orders JOIN customers ON customers.id = orders.customer_id"
+        first_page = self.db.fetch_query_page(query, limit=3, key='order_id')
+        self.assertEqual([row[1] for row in first_page], [1, 2, 3])
+        second_page = self.db.fetch_query_page(query, after_key=3, limit=3, key='order_id')
+        self.assertEqual([row[1] for row in second_page], [4])
+
+        by_name = self.db.fetch_query_page(query, after_key=('Katarzyna Wójcik', 3), key='order_id', order_by='customer_name')
+        self.assertEqual([row[0] for row in by_name], ['Michał Kowalski', 'Piotr Wiśniewski'])
+
     def test_delete_record(self):
         self.db.delete_record('customers', 1)
         customers = self.db.fetch_all_customers()
         self.assertEqual(len(customers), 3)
 
+    def test_delete_records(self):
+        deleted = self.db.delete_records('customers', [1, 3, 3, 1, 99], chunk_size=2)
+        self.assertEqual(deleted, 2)
+        customers = self.db.fetch_all_customers()
+        self.assertEqual([customer[0] for customer in customers], [2, 4])
+
     def test_update_record(self):
         self.db.update_record('customers', 1, 'name', 'Jan Kowalski')
         customers = self.db.fetch_all_customers()
         self.assertEqual(customers[0][1], 'Jan Kowalski')
 
+    def test_transaction_emits_record_updated_once(self):
+        emitted = []
+        self.db.record_updated.connect(lambda: emitted.append(True))
+        with self.db.transaction():
+            self.db.update_record('customers', 1, 'name', 'Jan Kowalski')
+            self.db.update_record('customers', 2, 'name', 'Anna Kowalska')
+            self.assertEqual(emitted, [])
+        self.assertEqual(emitted, [True])
+        self.assertFalse(self.db.conn.in_transaction)
+        customers = self.db.fetch_all_customers()
+        self.assertEqual([customer[1] for customer in customers[:2]], ['Jan Kowalski', 'Anna Kowalska'])
+
+    def test_records_changed_events(self):
+        events = []
+        self.db.records_changed.connect(lambda table, operation, ids: events.append((table, operation, ids)))
+        with self.db.transaction():
+            self.db.update_record('products', 1, 'price', 10.0)
+            self.db.update_record('products', 2, 'price', 20.0)
+            self.db.update_record('products', 1, 'stock', 5)
+            self.db.delete_records('orders', [3, 4])
+            self.assertEqual(events, [])
+        record_id = self.db.insert_record('customers', ('Adam Nowicki', 'adam@example.com', '123-456-789', 'Poznań'))
+        self.assertEqual(record_id, 5)
+        self.assertEqual(events, [('products', 'update', [1, 2]), ('orders', 'delete', [3, 4]),
+                                  ('customers', 'insert', [5])])
+
+    def test_transaction_rolls_back_on_error(self):
+        emitted = []
+        self.db.record_updated.connect(lambda: emitted.append(True))
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.db.transaction():
+                self.db.delete_record('customers', 1)
+                self.db.update_record('customers', 2, 'missing', 'value')
+        self.assertEqual(len(self.db.fetch_all_customers()), 4)
+        self.assertEqual(emitted, [])
+
+    def test_failed_transaction_keeps_queued_writes(self):
+        events = []
+        self.db.records_changed.connect(lambda table, operation, ids: events.append((table, operation, ids)))
+        self.db.set_write_behind(10000)
+        self.db.update_record('customers', 1, 'name', 'Jan Kowalski')
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.db.transaction():
+                self.db.update_record('customers', 2, 'name', 'Anna Kowalska')
+                self.db.update_record('customers', 2, 'missing', 'value')
+        self.db.flush()
+        self.assertFalse(self.db.conn.in_transaction)
+        customers = self.db.fetch_all_customers()
+        self.assertEqual(customers[0][1], 'Jan Kowalski')
+        self.assertNotEqual(customers[1][1], 'Anna Kowalska')
+        self.assertEqual(events, [('customers', 'update', [1])])
+        self.db.set_write_behind(None)
+
+    def test_schema_catalog_is_cached_until_ddl(self):
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        self.db.insert_record('customers', ('Jan Kowalski', 'jan@example.com', '111-222-333', 'Kraków'))
+        self.db.insert_record('customers', ('Anna Nowak', 'anna@example.com', '444-555-666', 'Gdańsk'))
+        self.db.conn.set_trace_callback(None)
+        self.assertEqual(len([sql for sql in statements if 'PRAGMA table_info' in sql]), 1)
+        self.assertEqual(len(self.db.fetch_all_customers()), 6)
+
+        self.db.export_to_csv('test.csv')
+        self.db.import_from_csv('test.csv')
+        os.remove('test.csv')
+        self.assertEqual(self.db.get_column_types('products'), ['INTEGER', 'TEXT', 'TEXT', 'REAL', 'INTEGER'])
+        self.assertEqual(self.db.get_table_schema('products')['affinities'], ['int', 'str', 'str', 'float', 'int'])
+
+    def test_column_stats_follow_changes(self):
+        self.assertEqual(self.db.get_column_unique_values('orders', 'status'),
+                         ['Anulowane', 'Dostarczone', 'W realizacji', 'Wysłane'])
+        self.db.update_record('orders', 1, 'status', 'Dostarczone')
+        self.db.update_record('orders', 2, 'amount', 10)
+        self.db.update_record('orders', 3, 'customer_id', None)
+        self.assertNotIn('Wysłane', self.db.get_column_unique_values('orders', 'status'))
+        self.assertEqual(dict(self.db.get_column_value_counts('orders', 'status'))['Dostarczone'], 2)
+        self.assertEqual(self.db.get_min_max_value('orders', 'amount'), (1, 10))
+        self.assertIn(None, self.db.get_column_unique_values('orders', 'customer_id'))
+
+        self.db.delete_records('orders', [1, 2])
+        self.db.insert_record('products', ('Monitor', 'Elektronika', 9999.0, 3))
+        self.assertEqual(self.db.get_min_max_value('products', 'price'), (599.0, 9999.0))
+        for table, columns in self.db.COLUMN_STATS.items():
+            for column in columns:
+                expected = self.db.conn.execute(
+                    f"SELECT {column}, COUNT(*) FROM {table} GROUP BY {column} ORDER BY {column}").fetchall()
+                self.assertEqual(self.db.get_column_value_counts(table, column), expected)
+
+    def test_get_column_facets(self):
+        self.db.update_record('orders', 1, 'status', 'Dostarczone')
+        self.assertEqual(self.db.get_column_facets('orders', 'status', limit=2), [('Dostarczone', 2), ('Anulowane', 1)])
+        self.assertEqual(self.db.get_column_facets('orders', 'status', 'w r'), [('W realizacji', 1)])
+        self.assertEqual(self.db.get_column_facets('customers', 'name', 'anna'), [('Anna Nowak', 1)])
+        self.assertEqual(self.db.get_column_facets('customers', 'name', '_'), [])
+
+    def test_import_from_csv_rebuilds_column_stats(self):
+        self.db.export_to_csv('test.csv')
+        self.db.update_record('customers', 1, 'city', 'Sopot')
+        self.db.import_from_csv('test.csv')
+        os.remove('test.csv')
+        self.assertNotIn('Sopot', self.db.get_column_unique_values('customers', 'city'))
+        self.assertEqual(sum(count for _, count in self.db.get_column_value_counts('customers', 'city')), 4)
+
     def test_export_to_csv(self):
         self.db.export_to_csv('test.csv')
         with open('test.csv', 'r', encoding="utf-8") as file:
@@ -39,6 +224,15 @@ class TestDatabase(unittest.TestCase):
             self.assertEqual(rows[1][1], 'Michał Kowalski')
         os.remove('test.csv')
 
+    def test_export_to_csv_in_chunks(self):
+        self.db.export_to_csv('test.csv', chunk_size=1)
+        self.db.import_from_csv('test.csv')
+        customers = self.db.fetch_all_customers()
+        self.assertEqual(len(customers), 4)
+        self.assertEqual(customers[3][1], 'Katarzyna Wójcik')
+        self.assertEqual(len(self.db.fetch_customer_orders()), 4)
+        os.remove('test.csv')
+
     def test_import_from_csv(self):
         with open('test_import.csv', 'w', encoding="utf-8", newline='') as file:
             writer = csv.writer(file)
@@ -57,5 +251,224 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(customers[0][1], 'Test User')
         os.remove('test_import.csv')
 
+    def test_import_from_csv_parallel(self):
+        self.db.export_to_csv('test.csv')
+        self.db.import_from_csv('test.csv', workers=2)
+        customers = self.db.fetch_all_customers()
+        self.assertEqual(len(customers), 4)
+        self.assertEqual(customers[2][1], 'Piotr Wiśniewski')
+        self.db.c.execute("SELECT typeof(price) FROM products")
+        self.assertEqual({row[0] for row in self.db.c.fetchall()}, {'real'})
+        self.assertEqual(len(self.db.fetch_customer_orders()), 4)
+        os.remove('test.csv')
+
+    def test_import_modes_accept_edited_database(self):
+        self.db.update_record('orders', 1, 'amount', 2.5)
+        self.db.update_record('orders', 2, 'amount', 'dużo')
+        self.db.export_to_csv('test.csv')
+        query = "SELECT amount, typeof(amount) FROM orders ORDER BY id"
+        expected = self.db.conn.execute(query).fetchall()
+        for workers in [1, 2]:
+            self.db.import_from_csv('test.csv', workers=workers)
+            self.assertEqual(self.db.conn.execute(query).fetchall(), expected)
+        self.assertEqual(expected[:2], [(2.5, 'real'), ('dużo', 'text')])
+        os.remove('test.csv')
+
+    def test_find_chunks_respects_sections(self):
+        self.db.export_to_csv('test.csv')
+        chunks = find_chunks('test.csv', self.db.TABLES, chunk_bytes=1)
+        tables = [table for table, _, _ in chunks]
+        self.assertEqual(sorted(tables, key=self.db.TABLES.index), tables)
+        self.assertEqual(set(tables), set(self.db.TABLES))
+        self.assertTrue(all(start < end for _, start, end in chunks))
+        rows = parse_chunk('test.csv', chunks[0][1], chunks[0][2], ['int', 'str', 'str', 'str', 'str'])
+        self.assertEqual(rows, [(1, 'Michał Kowalski', 'michal.kowalski@gmail.com', '501-234-567', 'Warszawa')])
+        os.remove('test.csv')
+
+    def test_import_from_csv_rolls_back_on_error(self):
+        with open('test_import.csv', 'w', encoding="utf-8", newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['Customers'])
+            writer.writerow([1, 'Test User', 'test.user@example.com', '123-456-789', 'Test City'])
+            writer.writerow([2, 'Broken Row'])
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.db.import_from_csv('test_import.csv', batch_size=1)
+        customers = self.db.fetch_all_customers()
+        self.assertEqual(len(customers), 4)
+        self.assertEqual(customers[0][1], 'Michał Kowalski')
+        os.remove('test_import.csv')
+
+    def test_indexes(self):
+        self.assertIn('idx_orders_status', self.db.get_indexes('orders'))
+        query = "SELECT * FROM orders WHERE status IN (?, ?)"
+        self.assertEqual(self.db.get_used_indexes(query, ['Wysłane', 'Anulowane']), ['idx_orders_status'])
+
+        self.db.drop_indexes(['idx_orders_status'])
+        self.assertNotIn('idx_orders_status', self.db.get_indexes('orders'))
+        self.assertEqual(self.db.get_used_indexes(query, ['Wysłane', 'Anulowane']), [])
+
+        self.db.create_indexes()
+        self.assertEqual(self.db.get_indexes(), sorted(self.db.INDEXES))
+
+    def test_import_from_csv_keeps_indexes(self):
+        self.db.export_to_csv('test.csv')
+        self.db.import_from_csv('test.csv')
+        self.assertEqual(self.db.get_indexes(), sorted(self.db.INDEXES))
+        os.remove('test.csv')
+
+    def search_customers(self, text):
+        self.db.c.execute("SELECT rowid FROM customers_fts WHERE customers_fts MATCH ? ORDER BY rowid",
+                          (self.db.build_match_query(text),))
+        return [row[0] for row in self.db.c.fetchall()]
+
+    def test_search_index(self):
+        self.assertEqual(self.search_customers('wis'), [3])
+        self.assertEqual(self.search_customers('KATARZYNA wój'), [4])
+        self.assertIsNone(self.db.build_match_query(' -'))
+        query = "SELECT * FROM orders WHERE customer_id IN (SELECT rowid FROM customers_fts WHERE customers_fts MATCH ?)"
+        self.assertEqual(self.db.get_used_indexes(query, ['"wis"*']), ['idx_orders_customer_id', 'customers_fts'])
+
+        self.db.update_record('customers', 1, 'name', 'Jan Nowicki')
+        self.assertEqual(self.search_customers('now'), [1, 2])
+        self.assertEqual(self.search_customers('michał'), [])
+
+        self.db.delete_record('customers', 2)
+        self.db.insert_record('customers', ('Anna Nowacka', 'anna@example.com', '111-222-333', 'Poznań'))
+        self.assertEqual(self.search_customers('now'), [1, 5])
+
+    def test_search_ignores_case_and_diacritics(self):
+        self.assertEqual(normalize_text('Łódź Wiśniewski'), 'lodz wisniewski')
+        self.assertEqual(self.search_customers('michal'), [1])
+        self.assertEqual(self.search_customers('WISNIEWSKI'), [3])
+        self.assertEqual(self.search_customers('wojcik'), [4])
+        self.db.c.execute("SELECT normalize(name) FROM customers WHERE id=4")
+        self.assertEqual(self.db.c.fetchone()[0], 'katarzyna wojcik')
+
+    def test_other_clients_can_write(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'test.db')
+            Database(path).conn.close()
+            conn = sqlite3.connect(path)
+            conn.execute("INSERT INTO customers (name, email, phone, city) VALUES ('Paweł Żak', 'p@example.com', '1', 'Łódź')")
+            conn.execute("UPDATE products SET name='Głośnik' WHERE id=1")
+            conn.execute("UPDATE orders SET status='Anulowane' WHERE id=1")
+            conn.execute("DELETE FROM orders WHERE id=2")
+            conn.commit()
+            conn.close()
+
+            db = Database(path)
+            for table, text, expected in [('customers', 'pawel zak', [(5,)]), ('products', 'GLOSNIK', [(1,)])]:
+                db.c.execute(f"SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?", (db.build_match_query(text),))
+                self.assertEqual(db.c.fetchall(), expected)
+            self.assertEqual(len(db.fetch_customer_orders()), 3)
+            db.conn.close()
+
+    def test_import_from_csv_rebuilds_search_index(self):
+        self.db.export_to_csv('test.csv')
+        self.db.import_from_csv('test.csv')
+        self.assertEqual(self.search_customers('anna'), [2])
+        os.remove('test.csv')
+
+    def test_populate_synthetic_data(self):
+        self.db.populate_synthetic_data(2000, customers=100, products=20, suppliers=5, seed=7)
+        counts = [self.db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in self.db.TABLES]
+        self.assertEqual(counts, [100, 2000, 20, 5])
+        self.assertEqual(len(self.db.fetch_customer_orders()), 2000)
+        statuses = dict(self.db.get_column_value_counts('orders', 'status'))
+        self.assertEqual(max(statuses, key=statuses.get), 'Dostarczone')
+        customers = self.db.fetch_all_customers()
+
+        other = Database()
+        other.populate_synthetic_data(2000, customers=100, products=20, suppliers=5, seed=7)
+        self.assertEqual(other.fetch_all_customers(), customers)
+        other.conn.close()
+
+    def test_normalize_sql(self):
+        self.assertEqual(normalize_sql("SELECT *  FROM orders /* schema 3 */\n WHERE id IN (?, ?, ?) AND status='W realizacji' LIMIT 10"),
+                         "SELECT * FROM orders WHERE id IN (...) AND status=? LIMIT ?")
+
+    def test_query_stats(self):
+        self.assertEqual(self.db.get_query_stats(), [])
+        db = Database(instrument=True)
+        db.reset_query_stats()
+        for record_id in [1, 2, 3]:
+            db.fetch_page('orders', after_key=record_id, limit=10)
+        db.delete_records('orders', [1, 2])
+        stats = {shape_stats["shape"]: shape_stats for shape_stats in db.get_query_stats()}
+        page_stats = stats["SELECT * FROM orders WHERE id > ? ORDER BY id ASC LIMIT ?"]
+        self.assertEqual((page_stats["count"], page_stats["rows"]), (3, 3 + 2 + 1))
+        self.assertEqual(sum(page_stats["histogram"]), 3)
+        self.assertLessEqual(page_stats["p95"], page_stats["max"])
+        self.assertEqual(stats["DELETE FROM orders WHERE id IN (...)"]["count"], 1)
+
+        db.conn.execute("SELECT name FROM customers").fetchone()
+        self.assertNotIn("SELECT name FROM customers", [shape_stats["shape"] for shape_stats in db.get_query_stats()])
+        db.conn.execute("SELECT ?", [1]).fetchall()
+        stats = {shape_stats["shape"]: shape_stats for shape_stats in db.get_query_stats()}
+        self.assertEqual((stats["SELECT name FROM customers"]["count"], stats["SELECT name FROM customers"]["rows"]),
+                         (1, 1))
+        db.conn.close()
+
+    def test_describe_parameters(self):
+        self.assertEqual(describe_parameters(['Wysłane', 1, 2, 3, 2.5]), '5: str, int x 3, float')
+        self.assertEqual(describe_parameters({'status': 'Wysłane'}), '1: status=str')
+        self.assertEqual(describe_parameters(()), 'none')
+
+    def test_slow_query_log(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_file = os.path.join(tmp_dir, 'slow.log')
+            db = Database(slow_query_log=log_file, slow_query_threshold=0)
+            db.conn.execute(
+                "SELECT * FROM orders WHERE status IN (?, ?) AND customer_id = ?", ['Wysłane', 'Anulowane', 1]
+            ).fetchall()
+            db.slow_query_log.close()
+            db.conn.close()
+            with open(log_file, 'r', encoding='utf-8') as file:
+                log = file.read()
+        self.assertIn('sql: SELECT * FROM orders WHERE status IN (?, ?) AND customer_id = ?', log)
+        self.assertIn('parameters: 3: str x 2, int', log)
+        self.assertIn('plan:\n    SEARCH orders USING INDEX', log)
+        self.assertNotIn('Wysłane', log)
+        self.assertNotIn('EXPLAIN', log)
+        self.assertNotIn('unavailable', log)
+
+    def test_file_backed_database_persists(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'test.db')
+            db = Database(path)
+            db.c.execute("PRAGMA journal_mode")
+            self.assertEqual(db.c.fetchone()[0], 'wal')
+            db.update_record('customers', 1, 'name', 'Jan Kowalski')
+            db.conn.close()
+
+            db = Database(path)
+            customers = db.fetch_all_customers()
+            self.assertEqual(len(customers), 4)
+            self.assertEqual(customers[0][1], 'Jan Kowalski')
+            db.conn.close()
+
+    def test_reopen_rebuilds_missing_derived_tables(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'test.db')
+            Database(path).conn.close()
+            conn = sqlite3.connect(path)
+            for table in ['customer_orders', 'column_values', 'customers_fts']:
+                conn.execute(f"DROP TABLE {table}")
+            conn.commit()
+            conn.close()
+
+            db = Database(path)
+            self.assertFalse(db.conn.in_transaction)
+            worker_conn = db.connect()
+            for table in ['customer_orders', 'column_values', 'customers_fts']:
+                self.assertGreater(worker_conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0], 0)
+            worker_conn.close()
+            db.conn.close()
+
+    def test_invalid_synchronous_mode(self):
+        with self.assertRaises(ValueError):
+            Database(synchronous='SOMETIMES')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
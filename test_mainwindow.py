@@ -1,15 +1,22 @@
 import sys
 import unittest
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
 from .mainwindow import MainWindow
+from .query_executor import QueryExecutor
+from .tabs.filter_window import FilterWindow
+from .tabs.diagnostics_window import DiagnosticsWindow
+from .tabs.table_model import RecordTableModel
 from unittest.mock import patch
 
 class TestMainWindow(unittest.TestCase):
     def setUp(self):
-        self.app = QApplication(sys.argv)
+        self.app = QApplication.instance() or QApplication(sys.argv)
         self.main_window = MainWindow()
 
     def tearDown(self):
+        self.main_window.close()
         self.app.quit()
 
     @patch('mainwindow.CustomersTab.add_record')
@@ -36,5 +43,233 @@ class TestMainWindow(unittest.TestCase):
             self.main_window.import_database()
             mock_import_from_csv.assert_called_once_with('test.csv')
 
+    def test_tab_fetches_records_on_demand(self):
+        db = self.main_window.db
+        db.c.executemany("INSERT INTO customers (name, email, phone, city) VALUES (?, ?, ?, ?)",
+                         [(f"Klient {i}", f"klient{i}@example.com", "000-000-000", "Kraków") for i in range(500)])
+        customers_tab = self.main_window.tab_widget.widget(0)
+        customers_tab.reload_data()
+        model = customers_tab.model
+        self.assertTrue(self.wait_until(lambda: model.rowCount() == model.batch_size))
+        self.assertTrue(model.canFetchMore())
+        while model.canFetchMore():
+            model.fetchMore()
+        self.assertEqual(model.rowCount(), 504)
+        self.assertEqual(model.index(503, 1).data(), "Klient 499")
+
+    def test_sort_tab_by_numeric_column(self):
+        products_tab = self.main_window.tab_widget.widget(2)
+        products_tab.table_view.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+        model = products_tab.model
+        self.assertEqual([model.index(row, 3).data() for row in range(model.rowCount())], ['4999.0', '2499.99', '799.99', '599.0'])
+
+    def test_delete_selected_rows(self):
+        orders_tab = self.main_window.tab_widget.widget(1)
+        self.main_window.tab_widget.setCurrentWidget(orders_tab)
+        orders_tab.table_view.selectAll()
+        with patch.object(orders_tab.db, 'delete_record') as mock_delete_record:
+            orders_tab.delete_record()
+        mock_delete_record.assert_not_called()
+        QTest.qWait(0)
+        self.assertEqual(orders_tab.model.rowCount(), 0)
+        self.assertEqual(self.main_window.db.fetch_customer_orders(), [])
+
+    def test_change_patches_join_tab_in_place(self):
+        join_tab = self.main_window.tab_widget.widget(4)
+        self.main_window.tab_widget.setCurrentWidget(join_tab)
+        resets = []
+        join_tab.model.modelReset.connect(lambda: resets.append(True))
+        self.main_window.db.update_record('products', 3, 'price', 10.0)
+        self.main_window.db.delete_record('orders', 2)
+        QTest.qWait(0)
+        self.assertEqual(resets, [])
+        self.assertEqual(join_tab.model.rowCount(), 3)
+        prices = {join_tab.model.record(row)[6]: join_tab.model.record(row)[5] for row in range(3)}
+        self.assertEqual(prices[1], 10.0)
+
+        join_tab.filters = {"Product Price": {"enabled": True, "min": 100, "max": 10000}}
+        join_tab.reload_data()
+        self.assertEqual(join_tab.model.rowCount(), 2)
+        self.main_window.db.update_record('products', 3, 'price', 20.0)
+        QTest.qWait(0)
+        self.assertEqual(join_tab.model.rowCount(), 2)
+        self.main_window.db.update_record('products', 3, 'price', 200.0)
+        QTest.qWait(0)
+        self.assertEqual(join_tab.model.rowCount(), 3)
+
+    def test_changes_keep_sort_order(self):
+        products_tab = self.main_window.tab_widget.widget(2)
+        self.main_window.tab_widget.setCurrentWidget(products_tab)
+        products_tab.table_view.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+        model = products_tab.model
+        cheapest_id = model.record(3)[0]
+        self.main_window.db.update_record('products', cheapest_id, 'price', 3000.0)
+        self.main_window.db.insert_record('products', ('Monitor', 'Elektronika', 1000.0, 5))
+        QTest.qWait(0)
+        self.assertEqual([model.index(row, 3).data() for row in range(model.rowCount())],
+                         ['4999.0', '3000.0', '2499.99', '1000.0', '799.99'])
+        self.assertEqual(model.record(1)[0], cheapest_id)
+
+    def test_change_refetches_only_loaded_rows(self):
+        db = self.main_window.db
+        db.c.executemany("INSERT INTO orders (customer_id, product_id, date, amount, status) VALUES (?, ?, ?, ?, ?)",
+                         [(1, 3, "2024-01-01", 1, "Wysłane")] * 1000)
+        db.conn.commit()
+        join_tab = self.main_window.tab_widget.widget(4)
+        self.main_window.tab_widget.setCurrentWidget(join_tab)
+        join_tab.sort_data(3, False)
+        model = join_tab.model
+        self.assertTrue(model.canFetchMore())
+
+        with patch.object(db, 'fetch_query_records', wraps=db.fetch_query_records) as mock_fetch_query_records:
+            db.update_record('products', 3, 'price', 10.0)
+            QTest.qWait(0)
+        query, params, column, ids = mock_fetch_query_records.call_args.args
+        fetched = db.fetch_query_records(query, params, column, ids, **mock_fetch_query_records.call_args.kwargs)
+        self.assertLessEqual(len(fetched), model.batch_size)
+        self.assertEqual(model.rowCount(), model.batch_size)
+        while model.canFetchMore():
+            model.fetchMore()
+        self.assertEqual(model.rowCount(), 1004)
+        self.assertTrue(all(record[5] == 10.0 for record in model.records if record[7] == 3))
+        self.assertEqual(model.records, sorted(model.records, key=lambda record: (record[3], record[6])))
+
+    def test_hidden_tab_refresh_is_deferred_and_coalesced(self):
+        join_tab = self.main_window.tab_widget.widget(4)
+        db = self.main_window.db
+        with patch.object(join_tab, 'apply_changes') as mock_apply_changes:
+            for price in [10.0, 20.0, 30.0]:
+                db.update_record('products', 3, 'price', price)
+            db.update_record('products', 1, 'price', 40.0)
+            QTest.qWait(0)
+            mock_apply_changes.assert_not_called()
+            self.main_window.tab_widget.setCurrentWidget(join_tab)
+            mock_apply_changes.assert_called_once_with('products', 'update', [3, 1])
+
+        with patch.object(join_tab, 'reload_data') as mock_reload_data:
+            self.main_window.refresh_scheduler.max_patch_ids = 1
+            db.update_record('customers', 1, 'name', 'Jan Kowalski')
+            db.update_record('customers', 2, 'name', 'Anna Kowalska')
+            QTest.qWait(0)
+            mock_reload_data.assert_called_once_with()
+
+    def test_scheduled_reload_of_tab_without_search(self):
+        suppliers_tab = self.main_window.tab_widget.widget(3)
+        self.main_window.tab_widget.setCurrentWidget(suppliers_tab)
+        self.assertIsNone(suppliers_tab.query_executor)
+        db = self.main_window.db
+        with db.transaction():
+            for i in range(self.main_window.refresh_scheduler.max_patch_ids + 1):
+                db.insert_record('suppliers', (f'Dostawca {i}', 'Jan', 'Kraków', f'd{i}@example.com'))
+        QTest.qWait(0)
+        self.assertEqual(suppliers_tab.model.rowCount(), suppliers_tab.model.batch_size)
+        self.assertEqual(suppliers_tab.model.index(4, 1).data(), 'Dostawca 0')
+
+    def test_merge_records_changes_only_differing_rows(self):
+        model = RecordTableModel(["ID", "Name"])
+        model.set_records([(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')])
+        events = []
+        model.modelReset.connect(lambda: events.append('reset'))
+        model.rowsInserted.connect(lambda parent, first, last: events.append(('insert', first)))
+        model.rowsRemoved.connect(lambda parent, first, last: events.append(('remove', first)))
+        model.rowsMoved.connect(lambda parent, start, end, destination, row: events.append(('move', start, row)))
+        model.dataChanged.connect(lambda top_left, bottom_right: events.append(('change', top_left.row())))
+        model.merge_records([(1, 'a'), (4, 'd'), (3, 'C'), (5, 'e')], 0)
+        self.assertEqual(model.records, [(1, 'a'), (4, 'd'), (3, 'C'), (5, 'e')])
+        self.assertEqual(events, [('remove', 1), ('move', 2, 1), ('change', 2), ('insert', 3)])
+
+    def test_merge_records_reorders_rows(self):
+        model = RecordTableModel(["ID", "Name"])
+        model.set_records([(key, str(key)) for key in range(50)])
+        records = [(key, str(key)) for key in [100] + list(range(49, 20, -1)) + list(range(0, 20, 2))]
+        model.merge_records(records, 0)
+        self.assertEqual(model.records, records)
+
+    def test_reload_with_unchanged_query_keeps_rows(self):
+        customers_tab = self.main_window.tab_widget.widget(0)
+        resets = []
+        customers_tab.model.modelReset.connect(lambda: resets.append(True))
+        self.main_window.db.conn.execute("UPDATE customers SET name='Jan Kowalski' WHERE id=1")
+        customers_tab.reload_data()
+        self.assertEqual(customers_tab.model.index(0, 1).data(), 'Michał Kowalski')
+        self.assertTrue(self.wait_until(lambda: customers_tab.model.index(0, 1).data() == 'Jan Kowalski'))
+        self.assertEqual(resets, [])
+
+    def test_diagnostics_window_lists_statements(self):
+        main_window = MainWindow(instrument=True)
+        customers_tab = main_window.tab_widget.widget(0)
+        customers_tab.search_textbox.setText('nowak')
+        customers_tab.search_timer.stop()
+        customers_tab.search_data()
+        self.assertTrue(self.wait_until(lambda: customers_tab.model.rowCount() == 1))
+        diagnostics_window = DiagnosticsWindow(main_window.db, main_window)
+        shapes = [diagnostics_window.table.item(row, 0).text() for row in range(diagnostics_window.table.rowCount())]
+        self.assertTrue(any('customers_fts MATCH ?' in shape for shape in shapes))
+        diagnostics_window.reset()
+        self.assertEqual(diagnostics_window.table.rowCount(), 0)
+        main_window.close()
+
+    def wait_until(self, condition, timeout=2000):
+        for _ in range(timeout // 10):
+            if condition():
+                return True
+            QTest.qWait(10)
+        return condition()
+
+    def test_query_executor_reports_all_errors(self):
+        executor = QueryExecutor(self.main_window.db)
+        failures = []
+        executor.query_failed.connect(lambda request_id, message: failures.append(message))
+        executor.submit("SELECT ?", [])
+        self.assertTrue(self.wait_until(lambda: failures))
+        self.assertIn("bindings", failures[0])
+        executor.submit("SELECT ?", [object()])
+        self.assertTrue(self.wait_until(lambda: len(failures) == 2))
+        executor.shutdown()
+
+    def test_search_delivers_latest_result_only(self):
+        customers_tab = self.main_window.tab_widget.widget(0)
+        delivered = []
+        customers_tab.query_executor.result_ready.connect(lambda request_id, records: delivered.append(request_id))
+        customers_tab.search_textbox.setText('kowal')
+        customers_tab.search_data()
+        customers_tab.search_textbox.setText('nowak')
+        customers_tab.search_data()
+        customers_tab.search_timer.stop()
+        self.assertTrue(self.wait_until(lambda: delivered))
+        QTest.qWait(100)
+        self.assertEqual(len(delivered), 1)
+        self.assertEqual(customers_tab.model.rowCount(), 1)
+        self.assertEqual(customers_tab.model.index(0, 1).data(), 'Anna Nowak')
+
+    def test_write_behind_coalesces_commits(self):
+        db = self.main_window.db
+        emitted = []
+        db.record_updated.connect(lambda: emitted.append(True))
+        db.set_write_behind(50)
+        db.update_record('customers', 1, 'name', 'Jan Kowalski')
+        db.update_record('customers', 2, 'name', 'Anna Kowalska')
+        self.assertTrue(db.conn.in_transaction)
+        self.assertTrue(self.wait_until(lambda: emitted))
+        self.assertFalse(db.conn.in_transaction)
+        self.assertEqual(emitted, [True])
+        db.set_write_behind(None)
+
+    def test_filter_window_narrows_facets(self):
+        orders_tab = self.main_window.tab_widget.widget(1)
+        prev_filters = {"Status": {"enabled": True, "values": ["Wysłane"]}}
+        filter_window = FilterWindow(orders_tab, orders_tab.get_filter_fields(), prev_filters)
+        model = filter_window.field_widgets["Status"]
+        self.assertEqual(model.rowCount(), 4)
+        self.assertEqual(model.index(0, 0).data(), 'Anulowane (1)')
+
+        filter_window.prefix_inputs["Status"].setText('w')
+        filter_window.prefix_inputs["Status"].setText('w r')
+        self.assertEqual(model.rowCount(), 4)
+        self.assertTrue(self.wait_until(lambda: model.rowCount() == 1))
+        model.setData(model.index(0, 0), Qt.CheckState.Checked.value, Qt.ItemDataRole.CheckStateRole)
+        self.assertEqual(filter_window.get_filters()["Status"]["values"], ['Wysłane', 'W realizacji'])
+        filter_window.deleteLater()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file